@@ -1,74 +1,191 @@
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+import functools
+import hashlib
+import logging
+import orjson
 import os
+import queue
+from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 
 # Import routes
 from routes.websocket import router as websocket_router
+from gemini.client import A2ASessionPool
 
 # Import cognitive assistance system
-from cognitive_assistance_system.a2a_integration import A2ACognitiveIntegration
+from cognitive_assistance_system.a2a_integration import CognitiveEngine, CognitiveSession
 
 # Load environment variables
 load_dotenv()
 
-# Create FastAPI app
-app = FastAPI(title="Cognitive Assistance System - Alzheimer's Support with A2A ADK")
+# Log through a queue so formatting and stream writes happen on a background
+# thread instead of blocking the event loop
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[QueueHandler(log_queue)],
+)
+log_listener.start()
+_log_listener_running = True
+# Apps currently between startup and shutdown; the listener is shared by all
+# of them and stops once the last one shuts down
+_log_listener_users = 0
 
-# Initialize cognitive assistance system
-cognitive_system = A2ACognitiveIntegration()
+def _acquire_log_listener():
+    """Register a running app, restarting the log listener if it was stopped."""
+    global _log_listener_running, _log_listener_users
+    if not _log_listener_running:
+        log_listener.start()
+        _log_listener_running = True
+    _log_listener_users += 1
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+def _release_log_listener():
+    """Unregister a running app, flushing and stopping the listener after the last one."""
+    global _log_listener_running, _log_listener_users
+    _log_listener_users -= 1
+    if _log_listener_users == 0 and _log_listener_running:
+        log_listener.stop()
+        _log_listener_running = False
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep the log listener running while the app serves and close its socket pool on shutdown."""
+    _acquire_log_listener()
+    try:
+        yield
+    finally:
+        await app.state.session_pool.close()
+        _release_log_listener()
 
-# Include routers
-app.include_router(websocket_router)
+# Resolved from this file so the app can be imported from any directory
+FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
 
-# Mount frontend static files
-app.mount("/static", StaticFiles(directory="../frontend"), name="static")
+@functools.lru_cache(maxsize=None)
+def _load_index():
+    """
+    Read the SPA shell once so later requests for "/" never touch the filesystem.
+    
+    Returns:
+        (body, headers) for index.html, or None if the frontend is missing
+    """
+    try:
+        body = (FRONTEND_DIR / "index.html").read_bytes()
+    except FileNotFoundError:
+        logging.getLogger(__name__).warning("Frontend not found at %s", FRONTEND_DIR)
+        return None
+    etag = '"%s"' % hashlib.sha1(body).hexdigest()
+    return body, {"ETag": etag, "Cache-Control": "public, max-age=60"}
 
-# Root endpoint - serve the frontend
-@app.get("/")
-def serve_index():
-    return FileResponse("../frontend/index.html")
+# Cognitive assistance endpoints. These return responses directly so
+# FastAPI skips its jsonable_encoder pass over the result.
+_PROFILE_UPDATED = orjson.dumps({"status": "success", "message": "Profile updated successfully"})
+_SESSION_RESET = orjson.dumps({"status": "success", "message": "Session reset successfully"})
 
-# Cognitive assistance endpoints
-@app.get("/api/cognitive/config")
-def get_cognitive_config():
+cognitive_router = APIRouter(prefix="/api/cognitive")
+
+@cognitive_router.get("/config")
+def get_cognitive_config(request: Request):
     """Get cognitive assistance system configuration for A2A ADK."""
-    return cognitive_system.get_a2a_config()
+    config = request.app.state.cognitive_system.get_a2a_config()
+    # The config is a read-only mapping, which orjson serializes through dict
+    return Response(content=orjson.dumps(config, default=dict), media_type="application/json")
 
-@app.get("/api/cognitive/session")
-def get_session_summary():
+@cognitive_router.get("/session")
+def get_session_summary(request: Request):
     """Get current session summary."""
-    return cognitive_system.get_session_summary()
+    summary = request.app.state.cognitive_system.get_session_summary()
+    return Response(content=orjson.dumps(summary), media_type="application/json")
 
-@app.post("/api/cognitive/profile")
-def update_user_profile(profile_data: dict):
+@cognitive_router.post("/profile")
+def update_user_profile(request: Request, profile_data: dict):
     """Update user profile information."""
-    cognitive_system.update_user_profile(profile_data)
-    return {"status": "success", "message": "Profile updated successfully"}
+    request.app.state.cognitive_system.update_user_profile(profile_data)
+    return Response(content=_PROFILE_UPDATED, media_type="application/json")
 
-@app.get("/api/cognitive/profile")
-def get_user_profile():
+@cognitive_router.get("/profile")
+def get_user_profile(request: Request):
     """Get current user profile."""
-    return cognitive_system.get_user_profile()
+    return ORJSONResponse(content=request.app.state.cognitive_system.get_user_profile())
 
-@app.post("/api/cognitive/reset")
-def reset_session():
+@cognitive_router.post("/reset")
+def reset_session(request: Request):
     """Reset the current session."""
-    cognitive_system.reset_session()
-    return {"status": "success", "message": "Session reset successfully"}
+    request.app.state.cognitive_system.reset_session()
+    return Response(content=_SESSION_RESET, media_type="application/json")
+
+def create_app(*, cognitive: bool = True) -> FastAPI:
+    """
+    Build the FastAPI application.
+    
+    Args:
+        cognitive: Enable the cognitive assistance system. When disabled the
+            WebSocket relays Google A2A ADK without enhancement and the
+            /api/cognitive endpoints are not registered.
+    """
+    app = FastAPI(
+        title="Cognitive Assistance System - Alzheimer's Support with A2A ADK",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+    # Pre-connected Google A2A ADK sockets shared by this app's clients
+    app.state.session_pool = A2ASessionPool(size=int(os.getenv("A2A_ADK_POOL_SIZE", 2)))
+    # Shared cognitive resources; each WebSocket client gets its own session
+    app.state.engine = CognitiveEngine() if cognitive else None
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include routers
+    app.include_router(websocket_router)
+    if cognitive:
+        app.state.cognitive_system = CognitiveSession(engine=app.state.engine)
+        app.include_router(cognitive_router)
+
+    # Mount frontend static files
+    app.mount("/static", StaticFiles(directory=FRONTEND_DIR, check_dir=False, html=True), name="static")
+
+    # Root endpoint - serve the frontend
+    @app.get("/")
+    async def serve_index(request: Request):
+        index = _load_index()
+        if index is None:
+            return Response(status_code=404)
+        body, headers = index
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="text/html", headers=headers)
+
+    return app
+
+app = create_app(cognitive=os.getenv("COGNITIVE_ASSISTANCE_ENABLED", "true").lower() != "false")
 
 # Run the application
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    uvicorn.run(
+        # Worker processes need an import string. A single worker serves the
+        # app already built here rather than importing this file again as "app".
+        "app:app" if workers > 1 else app,
+        host="127.0.0.1",
+        port=8000,
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+        workers=workers,
+    )
@@ -1,7 +1,158 @@
-import json
+import asyncio
+import base64
+import logging
 import os
+import orjson
+from collections import deque
+from functools import lru_cache
 from websockets import connect
-from typing import Dict, Optional, Any
+from websockets.protocol import State
+from typing import Deque, Dict, List, Optional, Any, Union
+
+logger = logging.getLogger(__name__)
+
+# Pre-templated 'realtime_input' fragments. Base64 never needs JSON
+# escaping, so media is spliced into the frame without a serializer.
+_REALTIME_INPUT_PREFIX = b'{"realtime_input":{"media_chunks":['
+_REALTIME_INPUT_SUFFIX = b']}}'
+_MEDIA_CHUNK_PREFIX = b'{"data":"'
+_AUDIO_CHUNK_SUFFIX = b'","mime_type":"audio/pcm"}'
+_IMAGE_CHUNK_SUFFIX = b'","mime_type":"image/jpeg"}'
+
+DEFAULT_SYSTEM_PROMPT = """You are a friendly AI Assistant that can see, hear, and respond in real-time. You can interrupt and be interrupted naturally in conversation. Use the visual and audio context provided to give helpful, contextual responses."""
+
+
+def _to_base64(media: Union[bytes, str]) -> bytes:
+    """Return base64 bytes for raw media, passing already-encoded strings through."""
+    if isinstance(media, str):
+        return media.encode("ascii")
+    return base64.b64encode(media)
+
+
+@lru_cache(maxsize=32)
+def _build_setup_bytes(model: str, voice: str, system_prompt: str) -> bytes:
+    """
+    Build and serialize the 'setup' payload for a real-time conversation.
+    
+    Cached because clients nearly always share the same voice and cognitive
+    assistance system prompt.
+    """
+    setup_message = {
+        "setup": {
+            "model": f"models/{model}",
+            "generation_config": {
+                "response_modalities": ["AUDIO"],
+                "speech_config": {
+                    "voice_config": {
+                        "prebuilt_voice_config": {
+                            "voice_name": voice
+                        }
+                    }
+                }
+            },
+            "system_instruction": {
+                "parts": [
+                    {
+                        "text": system_prompt
+                    }
+                ]
+            }
+        }
+    }
+    return orjson.dumps(setup_message)
+
+
+class _ClosedWS:
+    """
+    Stand-in for the Google A2A ADK socket while disconnected.
+    
+    Sending or receiving raises instead of silently doing nothing, so the
+    send methods need no per-call connection check.
+    """
+    
+    state = State.CLOSED
+    
+    async def send(self, message: Any) -> None:
+        raise ConnectionError("Google A2A ADK connection is not open")
+        
+    async def recv(self) -> Any:
+        raise ConnectionError("Google A2A ADK connection is not open")
+        
+    async def close(self) -> None:
+        pass
+
+
+_CLOSED = _ClosedWS()
+
+
+class A2ASessionPool:
+    """
+    Keeps WebSocket connections to Google A2A ADK open ahead of time.
+    
+    The API accepts a single setup message per connection, so sockets are
+    never shared between clients. Instead the TCP, TLS and WebSocket
+    handshakes are done in advance and each client leases an already-open
+    socket, which it owns from then on.
+    """
+    
+    def __init__(self, size: int = 2):
+        """
+        Initialize an empty pool; connections are opened on first use.
+        
+        Args:
+            size: Number of idle connections to keep ready
+        """
+        self.size = size
+        self.uri: Optional[str] = None
+        self._idle: Deque[Any] = deque()
+        self._refill_task: Optional[asyncio.Task] = None
+
+    async def acquire(self, uri: str) -> Any:
+        """
+        Lease an open connection, falling back to a fresh connect.
+        
+        Args:
+            uri: Google A2A ADK WebSocket endpoint
+            
+        Returns:
+            An open websockets client connection
+        """
+        if uri != self.uri:
+            await self.close()
+            self.uri = uri
+            
+        ws = None
+        while self._idle:
+            candidate = self._idle.popleft()
+            if candidate.state is State.OPEN:
+                ws = candidate
+                break
+                
+        self._schedule_refill()
+        return ws if ws is not None else await connect(uri)
+
+    def _schedule_refill(self) -> None:
+        """Top the pool back up in the background."""
+        if self.size > 0 and (self._refill_task is None or self._refill_task.done()):
+            self._refill_task = asyncio.get_running_loop().create_task(self._refill())
+
+    async def _refill(self) -> None:
+        """Open connections until the pool holds `size` idle sockets."""
+        uri = self.uri
+        try:
+            while len(self._idle) < self.size and uri == self.uri:
+                self._idle.append(await connect(uri))
+        except Exception as e:
+            logger.warning("Failed to pre-connect to Google A2A ADK: %s", e)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+        while self._idle:
+            await self._idle.popleft().close()
+
 
 class A2AADKConnection:
     """
@@ -9,8 +160,13 @@ class A2AADKConnection:
     Handles WebSocket communication, audio/video streaming, and response processing
     """
     
-    def __init__(self):
-        """Initialize the Google A2A ADK connection with API key from environment"""
+    def __init__(self, pool: Optional[A2ASessionPool] = None):
+        """
+        Initialize the Google A2A ADK connection with API key from environment
+        
+        Args:
+            pool: Optional pool of pre-connected sockets to lease from
+        """
         self.api_key = os.environ.get("A2A_ADK_API_KEY")
         if not self.api_key:
             raise ValueError("A2A_ADK_API_KEY environment variable is not set")
@@ -21,8 +177,16 @@ class A2AADKConnection:
             "google.ai.generativelanguage.v1alpha.GenerativeService.BidiGenerateContent"
             f"?key={self.api_key}"
         )
-        self.ws = None
+        self.pool = pool
+        self.ws: Any = _CLOSED
         self.config = None
+        self._setup_bytes: Optional[bytes] = None
+
+        # Media chunks queued during the current event-loop tick
+        self._media_chunks: List[bytes] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Error from a background media flush, raised by the next send
+        self._send_error: Optional[BaseException] = None
 
     def set_config(self, config_data: Dict[str, Any]) -> None:
         """
@@ -39,6 +203,13 @@ class A2AADKConnection:
         """
         self.config = config_data
 
+        # Serialized 'setup' payload, shared by every client with the same voice and prompt
+        self._setup_bytes = _build_setup_bytes(
+            self.model,
+            config_data.get("voice", "Puck"),
+            config_data.get("systemPrompt", DEFAULT_SYSTEM_PROMPT)
+        )
+
     async def connect(self) -> None:
         """
         Establish WebSocket connection and send initial setup message
@@ -51,67 +222,31 @@ class A2AADKConnection:
         if not self.config:
             raise ValueError("Configuration must be set before connecting.")
 
+        self._send_error = None
         try:
-            self.ws = await connect(self.uri)
-
-            # Build 'setup' payload for real-time conversation
-            setup_message = {
-                "setup": {
-                    "model": f"models/{self.model}",
-                    "generation_config": {
-                        "response_modalities": ["AUDIO"],
-                        "speech_config": {
-                            "voice_config": {
-                                "prebuilt_voice_config": {
-                                    "voice_name": self.config.get("voice", "Puck")
-                                }
-                            }
-                        }
-                    },
-                    "system_instruction": {
-                        "parts": [
-                            {
-                                "text": self.config.get(
-                                    "systemPrompt",
-                                    """You are a friendly AI Assistant that can see, hear, and respond in real-time. You can interrupt and be interrupted naturally in conversation. Use the visual and audio context provided to give helpful, contextual responses."""
-                                )
-                            }
-                        ]
-                    }
-                }
-            }
+            if self.pool is not None:
+                self.ws = await self.pool.acquire(self.uri)
+            else:
+                self.ws = await connect(self.uri)
 
             # Send setup as the first message
-            await self.ws.send(json.dumps(setup_message))
+            await self.ws.send(self._setup_bytes)
 
             # Read the initial response from Google A2A ADK (often just an ack)
             setup_response = await self.ws.recv()
-            print("Google A2A ADK setup response:", setup_response)
+            logger.info("Google A2A ADK setup response: %s", setup_response)
             
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Google A2A ADK API: {str(e)}")
 
-    async def send_audio(self, base64_pcm: str) -> None:
+    async def send_audio(self, pcm: Union[bytes, str]) -> None:
         """
-        Send 16-bit PCM audio (base64) to Google A2A ADK under 'realtime_input'.
+        Send 16-bit PCM audio to Google A2A ADK under 'realtime_input'.
         
         Args:
-            base64_pcm: Base64 encoded 16-bit PCM audio data
+            pcm: Raw 16-bit PCM bytes, or a base64 encoded string
         """
-        if not self.ws:
-            return
-            
-        payload = {
-            "realtime_input": {
-                "media_chunks": [
-                    {
-                        "data": base64_pcm,
-                        "mime_type": "audio/pcm"
-                    }
-                ]
-            }
-        }
-        await self.ws.send(json.dumps(payload))
+        self._queue_media_chunk(_to_base64(pcm), _AUDIO_CHUNK_SUFFIX)
 
     async def send_text(self, text: str) -> None:
         """
@@ -120,8 +255,10 @@ class A2AADKConnection:
         Args:
             text: Text content to send
         """
-        if not self.ws:
-            return
+        # Keep ordering with any media queued earlier in this tick
+        self._raise_send_error()
+        if self._media_chunks:
+            await self._flush_media_chunks()
             
         text_msg = {
             "client_content": {
@@ -134,55 +271,94 @@ class A2AADKConnection:
                 "turn_complete": True
             }
         }
-        await self.ws.send(json.dumps(text_msg))
+        await self.ws.send(orjson.dumps(text_msg))
 
-    async def send_image(self, base64_jpeg: str) -> None:
+    async def send_image(self, jpeg: Union[bytes, str]) -> None:
         """
         Send image data to Google A2A ADK for visual context.
         
         Args:
-            base64_jpeg: Base64 encoded JPEG image data
+            jpeg: Raw JPEG bytes, or a base64 encoded string
         """
-        if not self.ws:
-            return
-            
-        payload = {
-            "realtime_input": {
-                "media_chunks": [
-                    {
-                        "data": base64_jpeg,
-                        "mime_type": "image/jpeg"
-                    }
-                ]
-            }
-        }
-        await self.ws.send(json.dumps(payload))
+        self._queue_media_chunk(_to_base64(jpeg), _IMAGE_CHUNK_SUFFIX)
 
     async def send_interrupt(self) -> None:
         """
         Send interrupt signal to Google A2A ADK to stop current response
         """
-        if not self.ws:
-            return
+        self._raise_send_error()
+        if self._media_chunks:
+            await self._flush_media_chunks()
             
         interrupt_msg = {
             "interrupt": {}
         }
-        await self.ws.send(json.dumps(interrupt_msg))
+        await self.ws.send(orjson.dumps(interrupt_msg))
+
+    def _queue_media_chunk(self, data: bytes, chunk_suffix: bytes) -> None:
+        """
+        Queue a media chunk and schedule a single flush for this loop tick.
+        
+        Chunks queued before the flush runs are sent together as one
+        'realtime_input' message carrying several media_chunks.
+        
+        Args:
+            data: Base64 encoded media data
+            chunk_suffix: Pre-serialized tail of the chunk carrying its MIME type
+            
+        Raises:
+            ConnectionError: If the connection is not open
+            Exception: The error from an earlier background flush that failed
+        """
+        self._raise_send_error()
+        if self.ws is _CLOSED:
+            raise ConnectionError("Google A2A ADK connection is not open")
+        self._media_chunks.append(b"".join((_MEDIA_CHUNK_PREFIX, data, chunk_suffix)))
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_media_chunks())
+            self._flush_task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        """Log a failed background flush and keep its error for the next send."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Failed to send media to Google A2A ADK: %s", error)
+            self._send_error = error
+
+    def _raise_send_error(self) -> None:
+        """Raise the error from a failed background flush, if there was one."""
+        if self._send_error is not None:
+            raise self._send_error
+
+    async def _flush_media_chunks(self) -> None:
+        """Send all queued media chunks to Google A2A ADK in one write."""
+        chunks, self._media_chunks = self._media_chunks, []
+        self._flush_task = None
+        if not chunks:
+            return
+            
+        await self.ws.send(b"".join((_REALTIME_INPUT_PREFIX, b",".join(chunks), _REALTIME_INPUT_SUFFIX)))
 
     async def receive(self) -> Optional[str]:
         """
         Wait for next message from Google A2A ADK.
         
         Returns:
-            JSON response string or None if connection is closed
+            JSON response string
+            
+        Raises:
+            ConnectionError: If the connection is not open
         """
-        if not self.ws:
-            return None
         return await self.ws.recv()
 
     async def close(self) -> None:
         """Close the WebSocket connection."""
-        if self.ws:
-            await self.ws.close()
-            self.ws = None
+        # Queued media has nowhere to go once the socket is closed
+        flush_task, self._flush_task = self._flush_task, None
+        if flush_task is not None:
+            flush_task.cancel()
+        self._media_chunks = []
+        ws, self.ws = self.ws, _CLOSED
+        await ws.close()
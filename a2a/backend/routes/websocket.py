@@ -1,17 +1,101 @@
 import asyncio
-import json
+import functools
+import logging
+import msgspec
+import orjson
+from collections import deque
+from dataclasses import dataclass
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple, Union
 
 from gemini.client import A2AADKConnection
-from cognitive_assistance_system.a2a_integration import A2ACognitiveIntegration
+from cognitive_assistance_system.a2a_integration import CognitiveSession
+
+logger = logging.getLogger(__name__)
 
 # Create router
 router = APIRouter()
 
-# Store active connections
-connections: Dict[str, A2AADKConnection] = {}
-cognitive_systems: Dict[str, A2ACognitiveIntegration] = {}
+
+@dataclass(slots=True)
+class ClientState:
+    """Per-client resources held for the lifetime of a WebSocket session."""
+
+    adk: A2AADKConnection
+    cog: Optional[CognitiveSession]
+
+
+# Store active clients
+clients: Dict[str, ClientState] = {}
+
+# Media inputs queued for cognitive analysis; further media is dropped until
+# the analyzer catches up, so the Gemini relay never waits on it. Text is
+# never dropped.
+MAX_PENDING_COGNITIVE_INPUTS = 8
+
+# Messages buffered for a browser before the oldest audio is dropped to stay
+# realtime. Text and turn completion are only dropped past the hard limit.
+OUTBOUND_QUEUE_SIZE = 32
+OUTBOUND_HARD_LIMIT = 256
+
+# Seconds a Gemini text part waits for cognitive enhancement before it is
+# forwarded unchanged
+COGNITIVE_ENHANCE_TIMEOUT = 0.1
+
+# Pre-serialized envelope for audio relayed to the browser. Base64 never
+# needs JSON escaping, so the payload can be spliced in as-is.
+_AUDIO_FRAME_PREFIX = b'{"type":"audio","data":"'
+_AUDIO_FRAME_SUFFIX = b'"}'
+_TURN_COMPLETE_FRAME = orjson.dumps({"type": "turn_complete", "data": True})
+
+
+def _audio_frame(audio_data: str) -> bytes:
+    """Wrap base64 audio from Google A2A ADK in a frontend audio message."""
+    return b"".join((_AUDIO_FRAME_PREFIX, audio_data.encode("ascii"), _AUDIO_FRAME_SUFFIX))
+
+
+# Binary client frames start with one opcode byte selecting the message
+# type; the rest is the raw payload (PCM audio, JPEG image or UTF-8 text).
+_BINARY_OPCODES = {
+    b"\x00": "audio",
+    b"\x01": "image",
+    b"\x02": "text",
+    b"\x03": "interrupt",
+}
+
+
+class ClientMessage(msgspec.Struct, tag_field="type"):
+    """JSON message from the browser, tagged by its 'type' field."""
+    data: str = ""
+
+
+class AudioMessage(ClientMessage, tag="audio"):
+    data: str
+
+
+class ImageMessage(ClientMessage, tag="image"):
+    data: str
+
+
+class TextMessage(ClientMessage, tag="text"):
+    data: str
+
+
+class InterruptMessage(ClientMessage, tag="interrupt"):
+    pass
+
+
+# Parses and validates JSON client messages in a single pass
+_client_message_decoder = msgspec.json.Decoder(
+    Union[AudioMessage, ImageMessage, TextMessage, InterruptMessage]
+)
+
+
+def _batch_frames(frames: List[bytes]) -> bytes:
+    """Combine serialized frontend messages into a single JSON array frame."""
+    if len(frames) == 1:
+        return frames[0]
+    return b"".join((b"[", b",".join(frames), b"]"))
 
 @router.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
@@ -23,194 +107,334 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
         client_id: Unique client identifier
     """
     await websocket.accept()
-    print(f"Client connected: {client_id}")
+    logger.info("Client connected: %s", client_id)
 
-    # Create Google A2A ADK connection for this client
-    a2a_adk = A2AADKConnection()
-    connections[client_id] = a2a_adk
-    
-    # Create cognitive assistance system for this client
-    cognitive_system = A2ACognitiveIntegration(user_id=client_id)
-    cognitive_systems[client_id] = cognitive_system
+    # Create Google A2A ADK connection and, when enabled for the app, a
+    # cognitive assistance system for this client
+    a2a_adk = A2AADKConnection(pool=websocket.app.state.session_pool)
+    engine = websocket.app.state.engine
+    cognitive_system = CognitiveSession(client_id, engine) if engine is not None else None
+    clients[client_id] = ClientState(adk=a2a_adk, cog=cognitive_system)
 
     try:
         # 1) The first message from front-end must be "config"
-        initial_msg = await websocket.receive_json()
+        initial_msg = orjson.loads(await websocket.receive_text())
         if initial_msg.get("type") != "config":
             raise ValueError("First WebSocket message must be configuration.")
         
         # Extract and apply configuration with cognitive assistance
         config_data = initial_msg.get("config", {})
-        cognitive_config = cognitive_system.get_a2a_config()
-        # Merge cognitive assistance config with user config
-        merged_config = {**cognitive_config, **config_data}
-        a2a_adk.set_config(merged_config)
-        print(f"Received config for client {client_id} with cognitive assistance")
+        if cognitive_system is not None:
+            # Merge cognitive assistance config with user config
+            config_data = {**cognitive_system.get_a2a_config(), **config_data}
+        a2a_adk.set_config(config_data)
+        logger.info("Received config for client %s with cognitive assistance", client_id)
 
         # 2) Connect to Google A2A ADK (sends 'setup' message)
         await a2a_adk.connect()
-        print(f"Google A2A ADK connected for client {client_id} with cognitive assistance")
-
-        # 3) Start tasks: reading from client and reading from Google A2A ADK
-        receive_task = asyncio.create_task(receive_from_client(websocket, a2a_adk, cognitive_system, client_id))
-        send_task = asyncio.create_task(send_to_frontend(websocket, a2a_adk, cognitive_system))
+        logger.info("Google A2A ADK connected for client %s with cognitive assistance", client_id)
 
-        # Wait for either task to complete (or fail)
-        done, pending = await asyncio.wait(
-            [receive_task, send_task],
-            return_when=asyncio.FIRST_EXCEPTION
-        )
-        
-        # Cancel any pending tasks
-        for task in pending:
-            task.cancel()
-            
-        # Re-raise exceptions from completed tasks
-        for task in done:
-            if task.exception():
-                raise task.exception()
+        # 3) Run reading from client and reading from Google A2A ADK together.
+        # The group cancels the other task on failure; a task that simply
+        # finishes (e.g. the client disconnected) cancels its sibling too.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                receive_task = tg.create_task(receive_from_client(websocket, a2a_adk, cognitive_system, client_id))
+                send_task = tg.create_task(send_to_frontend(websocket, a2a_adk, cognitive_system))
+                receive_task.add_done_callback(lambda _: send_task.cancel())
+                send_task.add_done_callback(lambda _: receive_task.cancel())
+        except ExceptionGroup as group:
+            # Surface the first task failure to the handlers below
+            raise group.exceptions[0]
 
     except WebSocketDisconnect:
-        print(f"Client disconnected: {client_id}")
+        logger.info("Client disconnected: %s", client_id)
     except ValueError as e:
-        print(f"Validation error for client {client_id}: {e}")
-        await websocket.send_json({"type": "error", "message": str(e)})
+        logger.warning("Validation error for client %s: %s", client_id, e)
+        await websocket.send_bytes(orjson.dumps({"type": "error", "message": str(e)}))
     except Exception as e:
-        print(f"Error in WebSocket handler for client {client_id}: {e}")
+        logger.exception("Error in WebSocket handler for client %s", client_id)
         try:
-            await websocket.send_json({"type": "error", "message": f"Server error: {str(e)}"})
+            await websocket.send_bytes(orjson.dumps({"type": "error", "message": f"Server error: {str(e)}"}))
         except:
             pass
     finally:
         # Clean up resources
         await a2a_adk.close()
-        if client_id in connections:
-            del connections[client_id]
-        if client_id in cognitive_systems:
-            del cognitive_systems[client_id]
+        clients.pop(client_id, None)
         
-        print(f"Connection closed for client {client_id}")
+        logger.info("Connection closed for client %s", client_id)
 
 
-async def receive_from_client(websocket: WebSocket, a2a_adk: A2AADKConnection, cognitive_system: A2ACognitiveIntegration, client_id: str = None):
+async def _iter_client_frames(websocket: WebSocket) -> AsyncIterator[Union[bytes, str]]:
+    """
+    Yield the payload of each client frame until the client disconnects.
+    
+    Binary and text frames share one reader, since a WebSocket only supports
+    a single concurrent receiver.
+    """
+    receive = websocket.receive
+    while True:
+        message = await receive()
+        if message["type"] == "websocket.disconnect":
+            logger.debug("Client disconnected.")
+            return
+        frame = message.get("bytes")
+        yield frame if frame is not None else message["text"]
+
+
+async def receive_from_client(websocket: WebSocket, a2a_adk: A2AADKConnection, cognitive_system: Optional[CognitiveSession], client_id: str = None):
     """
     Process incoming messages from the client browser with cognitive assistance
     
     Args:
         websocket: WebSocket connection
         a2a_adk: A2AADKConnection instance for this client
-        cognitive_system: Cognitive assistance system for this client
+        cognitive_system: Cognitive assistance system for this client, or None if disabled
     """
-    while True:
+    # The cognitive result is not needed on this path, so analysis runs in
+    # background workers alongside the Gemini relay. Typed text is where an
+    # emergency ("help, I fell") shows up, so it has its own unbounded queue
+    # and is never dropped; media analysis is bounded and sheds load instead.
+    text_analysis_q: asyncio.Queue = asyncio.Queue()
+    media_analysis_q: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_COGNITIVE_INPUTS)
+    analyzers: Dict[asyncio.Queue, asyncio.Task] = {}
+    if cognitive_system is not None:
+        for queue in (text_analysis_q, media_analysis_q):
+            analyzer = asyncio.create_task(_analyze_client_inputs(cognitive_system, queue))
+            analyzer.add_done_callback(functools.partial(_report_analyzer_exit, client_id))
+            analyzers[queue] = analyzer
+
+    def schedule_analysis(input_type: str, content: str) -> None:
+        if not content:
+            # Raw binary media has nothing for the cognitive agents to read
+            return
+        queue = text_analysis_q if input_type == "text" else media_analysis_q
+        analyzer = analyzers.get(queue)
+        if analyzer is None or analyzer.done():
+            # Keep relaying without analysis rather than queueing for a dead worker
+            return
         try:
-            # Receive WebSocket message
-            message = await websocket.receive()
-            
-            # Handle disconnection
-            if message["type"] == "websocket.disconnect":
-                print("Client disconnected.")
-                return
-            
-            # Parse the message content
-            content = json.loads(message["text"])
-            msg_type = content["type"]
-
-            # Route to appropriate handler based on message type
-            if msg_type == "audio":
-                # Process through cognitive assistance system first
-                cognitive_response = await cognitive_system.process_multimodal_input({
-                    "type": "audio",
-                    "content": content["data"]
-                })
-                # Send to Google A2A ADK for response generation
-                await a2a_adk.send_audio(content["data"])
-            elif msg_type == "image":
-                # Process through cognitive assistance system first
-                cognitive_response = await cognitive_system.process_multimodal_input({
-                    "type": "image", 
-                    "content": content["data"]
-                })
-                # Send to Google A2A ADK
-                await a2a_adk.send_image(content["data"])
-            elif msg_type == "text":
-                # Process through cognitive assistance system first
-                cognitive_response = await cognitive_system.process_multimodal_input({
-                    "type": "text",
-                    "content": content["data"]
-                })
-                await a2a_adk.send_text(content["data"])
-            elif msg_type == "interrupt":
-                await a2a_adk.send_interrupt()
-            else:
-                print(f"Unknown message type from client: {msg_type}")
-
-        except json.JSONDecodeError:
-            print("Received invalid JSON from client")
-        except KeyError as e:
-            print(f"Missing required field in client message: {e}")
-        except Exception as e:
-            print(f"Error processing client message: {e}")
-            break
-
-
-async def send_to_frontend(websocket: WebSocket, a2a_adk: A2AADKConnection, cognitive_system: A2ACognitiveIntegration):
+            queue.put_nowait({"type": input_type, "content": content})
+        except asyncio.QueueFull:
+            logger.warning("Cognitive analysis is behind; dropped %s input for client %s", input_type, client_id)
+
+    try:
+        async for frame in _iter_client_frames(websocket):
+            try:
+                if isinstance(frame, bytes):
+                    # Binary frame: opcode byte followed by the raw payload
+                    msg_type = _BINARY_OPCODES.get(frame[:1])
+                    data = frame[1:]
+                    if msg_type == "text":
+                        data = data.decode("utf-8")
+                    # Raw media carries no text for the cognitive agents to match on
+                    cognitive_content = data if msg_type == "text" else ""
+                else:
+                    # Parse and validate the JSON message content
+                    content = _client_message_decoder.decode(frame)
+                    msg_type = content.__struct_config__.tag
+                    data = content.data
+                    cognitive_content = data
+
+                # Route to appropriate handler based on message type
+                match msg_type:
+                    case "audio":
+                        # Send to Google A2A ADK for response generation
+                        await a2a_adk.send_audio(data)
+                        schedule_analysis("audio", cognitive_content)
+                    case "image":
+                        # Send to Google A2A ADK
+                        await a2a_adk.send_image(data)
+                        schedule_analysis("image", cognitive_content)
+                    case "text":
+                        await a2a_adk.send_text(data)
+                        schedule_analysis("text", cognitive_content)
+                    case "interrupt":
+                        await a2a_adk.send_interrupt()
+                    case _:
+                        logger.warning("Unknown message type from client: %s", msg_type)
+
+            except msgspec.ValidationError as e:
+                logger.warning("Invalid message from client: %s", e)
+            except msgspec.DecodeError:
+                logger.warning("Received invalid JSON from client")
+            except UnicodeDecodeError:
+                logger.warning("Received invalid UTF-8 text from client")
+            except Exception as e:
+                logger.exception("Error processing client message")
+                break
+    finally:
+        for analyzer in analyzers.values():
+            analyzer.cancel()
+
+
+def _report_analyzer_exit(client_id: str, task: asyncio.Task) -> None:
+    """Log why a client's cognitive analysis worker stopped, if it failed."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Cognitive analysis stopped for client %s", client_id, exc_info=task.exception())
+
+
+async def _analyze_client_inputs(cognitive_system: CognitiveSession, analysis_q: asyncio.Queue):
+    """Analyze queued client input in arrival order."""
+    while True:
+        await cognitive_system.process_multimodal_input(await analysis_q.get())
+
+
+async def send_to_frontend(websocket: WebSocket, a2a_adk: A2AADKConnection, cognitive_system: Optional[CognitiveSession]):
     """
     Forward Google A2A ADK responses to the client browser with cognitive assistance
     
+    Audio parts are queued for the browser as soon as they arrive. Text parts
+    are enhanced by a separate worker so a slow cognitive system never holds
+    up audio from later responses.
+    
     Args:
         websocket: WebSocket connection
         a2a_adk: A2AADKConnection instance for this client
-        cognitive_system: Cognitive assistance system for this client
+        cognitive_system: Cognitive assistance system for this client, or None if disabled
     """
-    while True:
-        try:
-            # Get next message from Google A2A ADK
-            msg = await a2a_adk.receive()
-            if not msg:
-                continue
-
-            # Parse response
-            response = json.loads(msg)
-            
-            # Extract and forward parts (audio or text) with cognitive assistance
+    # Messages for the browser, written by a separate task
+    outbound = _OutboundBuffer()
+    # Text parts in arrival order; None marks a completed turn
+    text_q: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(_write_to_frontend(websocket, outbound))
+    enhancer = asyncio.create_task(_enhance_text_parts(cognitive_system, text_q, outbound))
+
+    try:
+        while True:
             try:
-                parts = response["serverContent"]["modelTurn"]["parts"]
-                for part in parts:
-                    if "inlineData" in part:
-                        # Audio data from Google A2A ADK (base64 PCM)
-                        audio_data = part["inlineData"]["data"]
-                        await websocket.send_json({"type": "audio", "data": audio_data})
-                    elif "text" in part:
-                        # Text from Google A2A ADK - enhance with cognitive assistance
-                        text_data = part["text"]
-                        print("Google A2A ADK text part:", text_data)
-                        
-                        # Process through cognitive assistance system for enhancement
-                        cognitive_response = await cognitive_system.process_multimodal_input({
-                            "type": "text",
-                            "content": text_data
-                        })
-                        
-                        # Send enhanced response
-                        enhanced_text = cognitive_response.get("text", text_data)
-                        await websocket.send_json({
-                            "type": "text", 
-                            "text": enhanced_text,
-                            "cognitive_assistance": True,
-                            "agent": cognitive_response.get("agent", "unknown")
-                        })
-            except KeyError:
-                # Not all responses have parts
-                pass
-
-            # Handle turn completion
+                # Get next message from Google A2A ADK
+                msg = await a2a_adk.receive()
+                if not msg:
+                    continue
+
+                # Surface a failed browser write
+                if writer.done():
+                    writer.result()
+
+                # Parse response
+                response = orjson.loads(msg)
+                
+                # Not all responses carry server content, parts or turn completion
+                server_content = response.get("serverContent")
+                if not server_content:
+                    continue
+
+                # Extract and forward parts (audio or text) with cognitive assistance
+                parts = server_content.get("modelTurn", {}).get("parts")
+                if parts:
+                    for part in parts:
+                        inline_data = part.get("inlineData")
+                        if inline_data is not None:
+                            # Audio data from Google A2A ADK (base64 PCM)
+                            audio_data = inline_data.get("data")
+                            if audio_data is None:
+                                # Skip a malformed part rather than ending the relay
+                                logger.warning("Google A2A ADK media part without data")
+                                continue
+                            outbound.put(_audio_frame(audio_data), audio=True)
+                        elif "text" in part:
+                            # Text from Google A2A ADK - enhance with cognitive assistance
+                            text_data = part["text"]
+                            logger.debug("Google A2A ADK text part: %s", text_data)
+                            text_q.put_nowait(text_data)
+
+                # Handle turn completion, ordered after any pending text
+                if server_content.get("turnComplete"):
+                    text_q.put_nowait(None)
+
+            except Exception as e:
+                logger.exception("Error processing Google A2A ADK response")
+                break
+    finally:
+        writer.cancel()
+        enhancer.cancel()
+
+
+class _OutboundBuffer:
+    """
+    Messages waiting to be written to one browser, oldest first.
+    
+    Once OUTBOUND_QUEUE_SIZE messages are waiting, the oldest audio is
+    removed in place to make room. Text and turn completion are kept up to
+    OUTBOUND_HARD_LIMIT messages, past which the oldest message of any kind
+    is dropped so a stalled browser cannot grow the buffer without bound.
+    """
+    
+    __slots__ = ("_frames", "_ready")
+    
+    def __init__(self):
+        # (is_audio, frame) pairs
+        self._frames: Deque[Tuple[bool, bytes]] = deque()
+        self._ready = asyncio.Event()
+    
+    def put(self, frame: bytes, audio: bool = False) -> None:
+        """Queue a message without blocking the Google A2A ADK reader."""
+        frames = self._frames
+        if len(frames) >= OUTBOUND_QUEUE_SIZE and not self._drop_oldest_audio():
+            if audio:
+                logger.warning("Outbound queue full, dropping audio for client")
+                return
+            if len(frames) >= OUTBOUND_HARD_LIMIT:
+                frames.popleft()
+                logger.error("Outbound queue at its hard limit, dropped oldest message for client")
+        frames.append((audio, frame))
+        self._ready.set()
+    
+    def _drop_oldest_audio(self) -> bool:
+        """Remove the oldest audio frame, returning whether one was found."""
+        frames = self._frames
+        for index, (audio, _) in enumerate(frames):
+            if audio:
+                del frames[index]
+                logger.warning("Outbound queue full, dropped oldest audio for client")
+                return True
+        return False
+    
+    async def take_all(self) -> List[bytes]:
+        """Wait until messages are queued, then remove and return all of them."""
+        await self._ready.wait()
+        self._ready.clear()
+        frames = [frame for _, frame in self._frames]
+        self._frames.clear()
+        return frames
+
+
+async def _write_to_frontend(websocket: WebSocket, outbound: _OutboundBuffer):
+    """Drain queued messages to the browser, coalescing whatever is ready into one write."""
+    while True:
+        await websocket.send_bytes(_batch_frames(await outbound.take_all()))
+
+
+async def _enhance_text_parts(cognitive_system: Optional[CognitiveSession], text_q: asyncio.Queue, outbound: _OutboundBuffer):
+    """Enhance text parts in order, forwarding the original text if enhancement is too slow."""
+    while True:
+        text_data = await text_q.get()
+        if text_data is None:
+            outbound.put(_TURN_COMPLETE_FRAME)
+            continue
+
+        if cognitive_system is None:
+            cognitive_response = {}
+        else:
             try:
-                if response["serverContent"]["turnComplete"]:
-                    await websocket.send_json({"type": "turn_complete", "data": True})
-            except KeyError:
-                # Not all responses indicate turn completion
-                pass
-
-        except Exception as e:
-            print(f"Error processing Google A2A ADK response: {e}")
-            break
+                # Process through cognitive assistance system for enhancement
+                cognitive_response = await asyncio.wait_for(
+                    cognitive_system.process_multimodal_input({
+                        "type": "text",
+                        "content": text_data
+                    }),
+                    timeout=COGNITIVE_ENHANCE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                cognitive_response = {}
+
+        # Send enhanced response
+        enhanced_text = cognitive_response.get("text", text_data)
+        outbound.put(orjson.dumps({
+            "type": "text", 
+            "text": enhanced_text,
+            "cognitive_assistance": "text" in cognitive_response,
+            "agent": cognitive_response.get("agent", "unknown")
+        }))
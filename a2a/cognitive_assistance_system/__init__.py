@@ -8,10 +8,22 @@ monitoring, and family communication.
 """
 
 from .core_assistant import CognitiveAssistant
-from .agents.memory_agent import MemoryAssistanceAgent
-from .agents.routine_agent import RoutineManagementAgent
-from .agents.safety_agent import SafetyMonitoringAgent
-from .agents.communication_agent import FamilyCommunicationAgent
+
+# Agents are re-exported lazily from the agents package (PEP 562)
+_AGENT_NAMES = frozenset({
+    "MemoryAssistanceAgent",
+    "RoutineManagementAgent",
+    "SafetyMonitoringAgent",
+    "FamilyCommunicationAgent",
+})
+
+def __getattr__(name):
+    if name not in _AGENT_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import agents
+    value = getattr(agents, name)
+    globals()[name] = value
+    return value
 
 __version__ = "1.0.0"
 __author__ = "Cognitive Assistance Team"
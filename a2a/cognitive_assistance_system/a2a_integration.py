@@ -7,68 +7,229 @@ and the Google A2A ADK multimodal API for real-time Alzheimer's support.
 
 import json
 import asyncio
-from typing import Dict, List, Optional, Any
+import hashlib
+import logging
+import re
+import time
+from typing import Dict, Mapping, Optional, Any, Tuple
 from datetime import datetime
 import uuid
+import msgspec
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 
 from .core_assistant import CognitiveAssistant
-from .agents.memory_agent import MemoryAssistanceAgent
-from .agents.routine_agent import RoutineManagementAgent
-from .agents.safety_agent import SafetyMonitoringAgent
-from .agents.communication_agent import FamilyCommunicationAgent
 
-class A2ACognitiveIntegration:
+logger = logging.getLogger(__name__)
+
+# System prompt optimized for Alzheimer's assistance. Google A2A ADK takes it
+# once per connection in the setup message, which is serialized once per
+# distinct prompt (see gemini.client._build_setup_bytes), so it is never
+# resent per turn.
+ALZHEIMER_SYSTEM_PROMPT = """You are a compassionate AI assistant specifically designed to help individuals with Alzheimer's disease and their families. Your role is to provide gentle, patient, and supportive assistance.
+
+Key Guidelines:
+1. Always speak in a calm, reassuring tone
+2. Be patient and never rush the user
+3. Use simple, clear language
+4. Repeat important information when needed
+5. Provide gentle reminders and encouragement
+6. Be understanding of memory challenges
+7. Offer emotional support and comfort
+8. Help with daily routines and safety
+9. Facilitate family communication
+10. Respond to emergencies with appropriate urgency
+
+Specialized Capabilities:
+- Memory assistance and reminiscence therapy
+- Daily routine management and medication reminders
+- Safety monitoring and emergency response
+- Family communication and caregiver coordination
+- Cognitive exercises and mental stimulation
+- Emotional support and companionship
+
+Remember: You are not just an AI assistant - you are a caring companion who understands the unique challenges of Alzheimer's disease and is here to provide meaningful support and assistance."""
+
+
+# A2A ADK configuration for Alzheimer's assistance. Nothing in it varies per
+# user, so every engine and session shares this one read-only mapping;
+# callers that need changes merge it into a new dict.
+_STATIC_A2A_CONFIG = MappingProxyType({
+    "systemPrompt": ALZHEIMER_SYSTEM_PROMPT,
+    "voice": "Puck",  # Gentle, calm voice
+    "googleSearch": True,
+    "allowInterruptions": True,
+    "response_modalities": ("AUDIO", "TEXT"),
+    "safety_features": MappingProxyType({
+        "emergency_detection": True,
+        "fall_detection": True,
+        "wandering_alert": True
+    })
+})
+
+# Safety agent response types that trigger emergency escalation
+_EMERGENCY_TYPES = frozenset({"emergency", "fall_incident"})
+
+class Metrics(msgspec.Struct):
+    """Per-session counters; CognitiveSession.metrics_snapshot gives the public dict form."""
+    total_interactions: int = 0
+    successful_responses: int = 0
+    emergency_triggers: int = 0
+    family_notifications: int = 0
+    response_time_sum_ns: int = 0
+    cache_hits: int = 0
+
+
+# Responses carry a full metrics snapshot once every this many turns
+METRICS_INTERVAL = 20
+
+# Replies to repeated questions are reused for this long, for at most this
+# many distinct questions per session
+RESPONSE_CACHE_TTL_NS = 5 * 60 * 10**9
+RESPONSE_CACHE_SIZE = 256
+
+# (agent, response type) pairs whose replies may be reused. Only lookups
+# with no side effects and no dependence on the current time qualify;
+# routine, communication and safety replies are always recomputed.
+_CACHEABLE_RESPONSES = frozenset({
+    ("memory_assistance", "fact_recall"),
+    ("memory_assistance", "reminiscence"),
+})
+
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+
+def _normalize_query(text: str) -> str:
+    """Reduce text to a cache key that ignores case, punctuation and spacing."""
+    return " ".join(_NON_WORD_RE.sub(" ", text.lower()).split())
+
+
+# Emotional context added around each agent's reply, as (prefix, suffix)
+_AGENT_CONTEXT = {
+    "memory_assistance": (
+        "\U0001F4AD ",
+        "\n\nTake your time remembering. I'm here to help you with your memories.",
+    ),
+    "safety_monitoring": (
+        "\U0001F6E1\uFE0F ",
+        "\n\nYour safety is my priority. I'm monitoring your wellbeing.",
+    ),
+    "routine_management": (
+        "\U0001F4C5 ",
+        "\n\nI'm here to help you stay on track with your daily routine.",
+    ),
+    "family_communication": (
+        "\U0001F4DE ",
+        "\n\nI'm helping you stay connected with your family and caregivers.",
+    ),
+}
+
+
+class CognitiveEngine:
+    """
+    Process-wide cognitive assistance resources shared by every session.
+    
+    Holds read-only state such as the A2A ADK configuration and system
+    prompt, so it is built once rather than per connected user.
+    """
+    
+    def __init__(self):
+        """Initialize the shared cognitive assistance resources."""
+        # A2A ADK configuration for Alzheimer's assistance
+        self.a2a_config = _STATIC_A2A_CONFIG
+    
+    def get_a2a_config(self) -> Mapping[str, Any]:
+        """
+        Get the A2A ADK configuration for Alzheimer's assistance.
+        
+        Returns:
+            Read-only configuration mapping for A2A ADK
+        """
+        return self.a2a_config
+
+
+@lru_cache(maxsize=None)
+def default_engine() -> CognitiveEngine:
+    """Return the engine shared by sessions created without an explicit one."""
+    return CognitiveEngine()
+
+
+class CognitiveSession:
     """
-    Integration class that connects the cognitive assistance system
+    Per-user session that connects the cognitive assistance system
     with the Google A2A ADK multimodal API.
+    
+    Only mutable per-user state lives here; shared resources come from the
+    CognitiveEngine.
     """
     
-    def __init__(self, user_id: str = None):
+    __slots__ = (
+        "user_id",
+        "_user_tag",
+        "engine",
+        "cognitive_assistant",
+        "_session_uuid",
+        "_session_id",
+        "session_start",
+        "session_start_monotonic",
+        "metrics",
+        "_response_cache",
+    )
+    
+    def __init__(self, user_id: str = None, engine: Optional[CognitiveEngine] = None):
         """
-        Initialize the A2A cognitive integration.
+        Initialize the A2A cognitive session.
         
         Args:
             user_id: Unique identifier for the user
+            engine: Shared cognitive engine, defaults to the process-wide one
         """
         self.user_id = user_id or str(uuid.uuid4())
+        # Short stable tag identifying the user in log records
+        self._user_tag = hashlib.blake2b(self.user_id.encode(), digest_size=4).hexdigest()
+        self.engine = engine or default_engine()
         self.cognitive_assistant = CognitiveAssistant(self.user_id)
         
-        # A2A ADK configuration for Alzheimer's assistance
-        self.a2a_config = {
-            "systemPrompt": self._get_alzheimer_system_prompt(),
-            "voice": "Puck",  # Gentle, calm voice
-            "googleSearch": True,
-            "allowInterruptions": True,
-            "response_modalities": ["AUDIO", "TEXT"],
-            "safety_features": {
-                "emergency_detection": True,
-                "fall_detection": True,
-                "wandering_alert": True
-            }
-        }
+        # Recent (time, A2A reply, agent reply) keyed by normalized question text
+        self._response_cache: "OrderedDict[str, Tuple[int, Dict[str, Any], Dict[str, Any]]]" = OrderedDict()
         
-        # Session management
-        self.session_id = str(uuid.uuid4())
+        self._start_session()
+    
+    def _start_session(self) -> None:
+        """Start a new session id, clock and metrics; shared by __init__ and reset_session."""
+        # The session id's text form is only built when first read
+        self._session_uuid = uuid.uuid4()
+        self._session_id: Optional[str] = None
         self.session_start = datetime.now()
-        self.interaction_count = 0
-        
-        # Performance metrics
-        self.metrics = {
-            "total_interactions": 0,
-            "successful_responses": 0,
-            "emergency_triggers": 0,
-            "family_notifications": 0,
-            "average_response_time": 0.0
-        }
+        self.session_start_monotonic = time.perf_counter_ns()
+        self.metrics = Metrics()
+    
+    @property
+    def session_id(self) -> str:
+        """Session identifier as 32 hex digits."""
+        if self._session_id is None:
+            self._session_id = self._session_uuid.hex
+        return self._session_id
+    
+    @property
+    def a2a_config(self) -> Mapping[str, Any]:
+        """A2A ADK configuration shared through the engine."""
+        return self.engine.a2a_config
     
-    def get_a2a_config(self) -> Dict[str, Any]:
+    def get_a2a_config(self) -> Mapping[str, Any]:
         """
         Get the A2A ADK configuration for Alzheimer's assistance.
         
         Returns:
-            Configuration dictionary for A2A ADK
+            Read-only configuration mapping for A2A ADK
         """
-        return self.a2a_config.copy()
+        return self.engine.get_a2a_config()
+    
+    @property
+    def average_response_time(self) -> float:
+        """Mean response time in seconds over this session's interactions."""
+        return self.metrics.response_time_sum_ns / max(1, self.metrics.total_interactions) / 1e9
     
     async def process_multimodal_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -81,33 +242,44 @@ class A2ACognitiveIntegration:
             Response for A2A ADK
         """
         try:
-            start_time = datetime.now()
-            self.interaction_count += 1
+            t0 = time.perf_counter_ns()
+            
+            # People often ask the same question repeatedly; answer those
+            # from recent replies instead of re-running the agents
+            cache_key = ""
+            if input_data.get("type") == "text":
+                cache_key = _normalize_query(input_data.get("content", ""))
+                cached = self._get_cached_response(cache_key, t0, input_data)
+                if cached is not None:
+                    self.metrics.cache_hits += 1
+                    self.metrics.response_time_sum_ns += time.perf_counter_ns() - t0
+                    self.metrics.total_interactions += 1
+                    self.metrics.successful_responses += 1
+                    return self._attach_metrics(cached)
             
             # Process input through cognitive assistant
             response = await self.cognitive_assistant.process_user_input(input_data)
             
-            # Calculate response time
-            response_time = (datetime.now() - start_time).total_seconds()
-            self.metrics["average_response_time"] = (
-                (self.metrics["average_response_time"] * (self.interaction_count - 1) + response_time) 
-                / self.interaction_count
-            )
-            
-            # Update metrics
-            self.metrics["total_interactions"] += 1
+            # Update metrics. Response times are summed as exact integers;
+            # the mean is derived on read so sessions can be rolled up.
+            self.metrics.response_time_sum_ns += time.perf_counter_ns() - t0
+            self.metrics.total_interactions += 1
             if not response.get("error"):
-                self.metrics["successful_responses"] += 1
+                self.metrics.successful_responses += 1
             
             # Check for emergency triggers
             if self._is_emergency_response(response):
-                self.metrics["emergency_triggers"] += 1
                 await self._handle_emergency_escalation(response)
             
             # Format response for A2A ADK
             a2a_response = self._format_a2a_response(response)
             
-            return a2a_response
+            if cache_key and (response.get("agent"), response.get("type")) in _CACHEABLE_RESPONSES:
+                self._response_cache[cache_key] = (t0, dict(a2a_response), response)
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+            
+            return self._attach_metrics(a2a_response)
             
         except Exception as e:
             return {
@@ -117,44 +289,38 @@ class A2ACognitiveIntegration:
                 "session_id": self.session_id
             }
     
-    def _get_alzheimer_system_prompt(self) -> str:
-        """Get the system prompt optimized for Alzheimer's assistance."""
-        return """
-You are a compassionate AI assistant specifically designed to help individuals with Alzheimer's disease and their families. Your role is to provide gentle, patient, and supportive assistance.
-
-Key Guidelines:
-1. Always speak in a calm, reassuring tone
-2. Be patient and never rush the user
-3. Use simple, clear language
-4. Repeat important information when needed
-5. Provide gentle reminders and encouragement
-6. Be understanding of memory challenges
-7. Offer emotional support and comfort
-8. Help with daily routines and safety
-9. Facilitate family communication
-10. Respond to emergencies with appropriate urgency
-
-Specialized Capabilities:
-- Memory assistance and reminiscence therapy
-- Daily routine management and medication reminders
-- Safety monitoring and emergency response
-- Family communication and caregiver coordination
-- Cognitive exercises and mental stimulation
-- Emotional support and companionship
-
-Remember: You are not just an AI assistant - you are a caring companion who understands the unique challenges of Alzheimer's disease and is here to provide meaningful support and assistance.
-        """.strip()
+    def _get_cached_response(self, cache_key: str, now_ns: int, input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return a fresh copy of a recent reply to the same question, if any.
+        
+        A hit is still recorded in the assistant's context and history.
+        """
+        if not cache_key:
+            return None
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_ns, a2a_response, response = entry
+        if now_ns - stored_ns > RESPONSE_CACHE_TTL_NS:
+            del self._response_cache[cache_key]
+            return None
+        self._response_cache.move_to_end(cache_key)
+        timestamp = datetime.now().isoformat()
+        self.cognitive_assistant.record_interaction(input_data, {**response, "timestamp": timestamp})
+        return {**a2a_response, "timestamp": timestamp}
     
     def _is_emergency_response(self, response: Dict[str, Any]) -> bool:
         """Check if the response indicates an emergency situation."""
-        if response.get("agent") == "safety_monitoring":
-            return response.get("type") in ["emergency", "fall_incident"]
-        return False
+        return response.get("agent") == "safety_monitoring" and response.get("type") in _EMERGENCY_TYPES
     
     async def _handle_emergency_escalation(self, response: Dict[str, Any]):
         """Handle emergency escalation procedures."""
-        # Log emergency
-        print(f"🚨 EMERGENCY DETECTED: {response.get('type', 'Unknown')}")
+        # Log emergency; the app routes log records through a background queue
+        logger.critical(
+            "Emergency detected: %s",
+            response.get("type", "Unknown"),
+            extra={"session_id": self.session_id, "user_tag": self._user_tag},
+        )
         
         # In a real system, this would:
         # 1. Send alerts to family members
@@ -162,47 +328,55 @@ Remember: You are not just an AI assistant - you are a caring companion who unde
         # 3. Update caregiver dashboards
         # 4. Log the incident for medical records
         
-        self.metrics["emergency_triggers"] += 1
+        self.metrics.emergency_triggers += 1
     
     def _format_a2a_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """Format response for A2A ADK compatibility."""
         # Extract the main content
         content = response.get("content", "I'm here to help you.")
         
+        agent = response.get("agent", "cognitive_assistant")
+        
         # Add emotional context for Alzheimer's assistance
-        if response.get("agent") == "memory_assistance":
-            content = self._add_memory_support_context(content)
-        elif response.get("agent") == "safety_monitoring":
-            content = self._add_safety_context(content)
-        elif response.get("agent") == "routine_management":
-            content = self._add_routine_context(content)
-        elif response.get("agent") == "family_communication":
-            content = self._add_communication_context(content)
+        decoration = _AGENT_CONTEXT.get(agent)
+        if decoration is not None:
+            content = decoration[0] + content + decoration[1]
         
         return {
             "text": content,
-            "agent": response.get("agent", "cognitive_assistant"),
+            "agent": agent,
             "timestamp": response.get("timestamp", datetime.now().isoformat()),
             "session_id": self.session_id,
-            "user_id": self.user_id,
-            "metrics": self.metrics
+            "user_id": self.user_id
         }
     
-    def _add_memory_support_context(self, content: str) -> str:
-        """Add memory support context to response."""
-        return f"💭 {content}\n\nTake your time remembering. I'm here to help you with your memories."
-    
-    def _add_safety_context(self, content: str) -> str:
-        """Add safety context to response."""
-        return f"🛡️ {content}\n\nYour safety is my priority. I'm monitoring your wellbeing."
-    
-    def _add_routine_context(self, content: str) -> str:
-        """Add routine context to response."""
-        return f"📅 {content}\n\nI'm here to help you stay on track with your daily routine."
+    def _attach_metrics(self, a2a_response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add session metrics to a response.
+        
+        A snapshot of the full metrics is only sent every METRICS_INTERVAL
+        turns and with safety responses; other turns carry just the
+        interaction sequence number. get_session_summary always has the
+        full metrics.
+        """
+        total = self.metrics.total_interactions
+        if a2a_response["agent"] == "safety_monitoring" or total % METRICS_INTERVAL == 0:
+            a2a_response["metrics"] = self.metrics_snapshot()
+        else:
+            a2a_response["metrics_seq"] = total
+        return a2a_response
     
-    def _add_communication_context(self, content: str) -> str:
-        """Add communication context to response."""
-        return f"📞 {content}\n\nI'm helping you stay connected with your family and caregivers."
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """
+        Session metrics as a plain dict.
+        
+        Keeps the original layout, with average_response_time in seconds
+        in place of the internal nanosecond sum.
+        """
+        metrics = msgspec.to_builtins(self.metrics)
+        del metrics["response_time_sum_ns"]
+        metrics["average_response_time"] = self.average_response_time
+        return metrics
     
     def get_session_summary(self) -> Dict[str, Any]:
         """Get a summary of the current session."""
@@ -210,15 +384,17 @@ Remember: You are not just an AI assistant - you are a caring companion who unde
             "session_id": self.session_id,
             "user_id": self.user_id,
             "start_time": self.session_start.isoformat(),
-            "duration_minutes": (datetime.now() - self.session_start).total_seconds() / 60,
-            "interaction_count": self.interaction_count,
-            "metrics": self.metrics,
+            "duration_minutes": (time.perf_counter_ns() - self.session_start_monotonic) / 6e10,
+            "interaction_count": self.metrics.total_interactions,
+            "average_response_time": self.average_response_time,
+            "metrics": self.metrics_snapshot(),
             "cognitive_assistant_summary": self.cognitive_assistant.get_session_summary()
         }
     
     def update_user_profile(self, profile_data: Dict[str, Any]):
         """Update user profile information."""
         self.cognitive_assistant.update_user_profile(profile_data)
+        self._response_cache.clear()
     
     def get_user_profile(self) -> Dict[str, Any]:
         """Get current user profile."""
@@ -226,13 +402,9 @@ Remember: You are not just an AI assistant - you are a caring companion who unde
     
     def reset_session(self):
         """Reset the current session."""
-        self.session_id = str(uuid.uuid4())
-        self.session_start = datetime.now()
-        self.interaction_count = 0
-        self.metrics = {
-            "total_interactions": 0,
-            "successful_responses": 0,
-            "emergency_triggers": 0,
-            "family_notifications": 0,
-            "average_response_time": 0.0
-        }
+        self._response_cache.clear()
+        self._start_session()
+
+
+# Name used before the engine/session split
+A2ACognitiveIntegration = CognitiveSession
@@ -5,10 +5,24 @@ This package contains specialized AI agents designed to provide targeted
 support for individuals with Alzheimer's disease and their caregivers.
 """
 
-from .memory_agent import MemoryAssistanceAgent
-from .routine_agent import RoutineManagementAgent
-from .safety_agent import SafetyMonitoringAgent
-from .communication_agent import FamilyCommunicationAgent
+import importlib
+
+# Agents are imported on first access (PEP 562) so importing the package
+# does not load every agent module up front
+_AGENT_MODULES = {
+    "MemoryAssistanceAgent": ".memory_agent",
+    "RoutineManagementAgent": ".routine_agent",
+    "SafetyMonitoringAgent": ".safety_agent",
+    "FamilyCommunicationAgent": ".communication_agent",
+}
+
+def __getattr__(name):
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "MemoryAssistanceAgent",
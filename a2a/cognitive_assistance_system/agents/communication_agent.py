@@ -6,18 +6,208 @@ with Alzheimer's disease and their family members, caregivers, and
 healthcare providers.
 """
 
-import json
+import itertools
+import logging
+import re
 import uuid
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from collections import deque
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any, Sequence, Set, Tuple
+from datetime import datetime
+from types import MappingProxyType
 import asyncio
 
+from .keywords import KeywordTable
+
+logger = logging.getLogger(__name__)
+
+
+# Request categories in dispatch priority order
+_REQUEST_KEYWORDS = KeywordTable((
+    ("call", ("call", "phone", "video", "talk to")),
+    ("message", ("message", "text", "send", "tell")),
+    ("family", ("family", "son", "daughter", "spouse")),
+    ("healthcare", ("doctor", "nurse", "medical", "healthcare")),
+    ("status", ("update", "how am i", "status", "report")),
+    ("support", ("help", "assistance", "support")),
+))
+
+_CALL_TARGETS = KeywordTable((
+    ("family", ("family", "son", "daughter", "spouse", "wife", "husband")),
+    ("healthcare", ("doctor", "nurse", "medical")),
+    ("emergency", ("emergency", "help", "911")),
+))
+
+_SUPPORT_TYPES = KeywordTable((
+    ("medical", ("medical", "health", "doctor")),
+    ("emotional", ("emotional", "lonely", "sad")),
+    ("practical", ("practical", "help", "assistance")),
+))
+
+_URGENT_RE = re.compile("urgent|emergency|important")
+_HEALTHCARE_RECIPIENT_RE = re.compile("doctor|medical|healthcare")
+
+
+class _BulletStyle(NamedTuple):
+    """How one kind of response lists a contact."""
+    key: str
+    name: str  # Shown when the contact has no name
+    fields: Tuple[Tuple[str, str, Optional[str]], ...]  # (label, key, default); None default means optional
+    title_key: Optional[str] = None  # Shown in parentheses after the name
+
+
+_CALL_STYLE = _BulletStyle("call", "Contact", (
+    ("Phone", "phone", "No phone"), ("Relationship", "relationship", None)))
+_FAMILY_INFO_STYLE = _BulletStyle("family_info", "Family Member", (
+    ("Relationship", "relationship", "Unknown"), ("Phone", "phone", None), ("Location", "location", None)))
+_FAMILY_CALL_STYLE = _BulletStyle("family_call", "Family Member", (
+    ("Phone", "phone", None),), title_key="relationship")
+_HEALTHCARE_CONTACT_STYLE = _BulletStyle("healthcare_contact", "Healthcare Provider", (
+    ("Type", "type", "Unknown"), ("Phone", "phone", None)))
+_APPOINTMENT_STYLE = _BulletStyle("appointment", "Healthcare Provider", (
+    ("Next appointment", "next_appointment", None),))
+_HEALTHCARE_INFO_STYLE = _BulletStyle("healthcare_info", "Healthcare Provider", (
+    ("Type", "type", "Unknown"), ("Specialty", "specialty", None)))
+_SUPPORT_STYLE = _BulletStyle("support", "Support Contact", (
+    ("Phone", "phone", None), ("Specialty", "specialty", None)))
+
+
+def _render_bullet(contact: Dict[str, Any], style: _BulletStyle) -> str:
+    """Format one contact as a bullet in the given style."""
+    title = f"• {contact.get('name', style.name)}"
+    if style.title_key:
+        title = f"{title} ({contact.get(style.title_key, 'Unknown')})"
+    lines = [title]
+    for label, key, default in style.fields:
+        if default is not None:
+            lines.append(f"  {label}: {contact.get(key, default)}")
+        elif contact.get(key):
+            lines.append(f"  {label}: {contact[key]}")
+    return "\n".join(lines)
+
+
+# Default contacts, shared read-only by every agent
+_DEFAULT_FAMILY = (
+    MappingProxyType({
+        "id": "family_001",
+        "name": "Sarah (Daughter)",
+        "relationship": "daughter",
+        "phone": "(555) 123-4567",
+        "email": "sarah@email.com",
+        "location": "New York",
+        "priority": "high",
+        "wants_updates": True,
+        "active": True
+    }),
+    MappingProxyType({
+        "id": "family_002",
+        "name": "John (Son)",
+        "relationship": "son",
+        "phone": "(555) 234-5678",
+        "email": "john@email.com",
+        "location": "California",
+        "priority": "high",
+        "wants_updates": True,
+        "active": True
+    })
+)
+
+_DEFAULT_PROVIDERS = (
+    MappingProxyType({
+        "id": "health_001",
+        "name": "Dr. Smith",
+        "type": "primary_care",
+        "specialty": "Geriatrics",
+        "phone": "(555) 987-6543",
+        "email": "dr.smith@clinic.com",
+        "next_appointment": "Next Tuesday at 2:00 PM",
+        "active": True
+    }),
+    MappingProxyType({
+        "id": "health_002",
+        "name": "Nurse Johnson",
+        "type": "nurse",
+        "specialty": "Home Care",
+        "phone": "(555) 876-5432",
+        "email": "nurse.johnson@clinic.com",
+        "active": True
+    })
+)
+
+# Number of call and message log entries kept per agent
+MAX_COMMUNICATION_LOG = 1000
+
+# Status updates are sent in batches of up to STATUS_BATCH_SIZE, or after
+# STATUS_FLUSH_DELAY seconds, whichever comes first
+STATUS_BATCH_SIZE = 16
+STATUS_FLUSH_DELAY = 0.01
+
+# Recipients notified at once while a batch is delivered
+STATUS_SEND_CONCURRENCY = 16
+
+
 class FamilyCommunicationAgent:
     """
     Specialized agent for family communication and caregiver coordination.
     Facilitates video calls, message delivery, and family updates.
     """
     
+    # Communication templates, shared by every agent
+    _TEMPLATES = MappingProxyType({
+        "daily_update": MappingProxyType({
+            "subject": "Daily Update",
+            "template": "Good {time_of_day}! Here's how {user_name} is doing today..."
+        }),
+        "medication_reminder": MappingProxyType({
+            "subject": "Medication Reminder",
+            "template": "Reminder: {user_name} needs to take {medication} at {time}"
+        }),
+        "appointment_reminder": MappingProxyType({
+            "subject": "Appointment Reminder", 
+            "template": "Reminder: {user_name} has an appointment with {doctor} at {time}"
+        }),
+        "safety_alert": MappingProxyType({
+            "subject": "Safety Alert",
+            "template": "Safety Alert: {user_name} may need assistance. {details}"
+        })
+    })
+    communication_templates = _TEMPLATES
+    
+    # Fixed replies for when no contacts are available
+    _NO_FAMILY_INFO = "I don't have family information available right now."
+    _NO_FAMILY_CONTACTS = "I don't have family contact information available right now."
+    _NO_PROVIDER_INFO = "I don't have healthcare provider information available right now."
+    _NO_MESSAGE_RECIPIENTS = "I don't have contact information for sending messages right now."
+    
+    # General communication replies, chosen by the first keyword found
+    _GENERAL_RESPONSES = (
+        "I'm here to help you communicate with your family and caregivers. What do you need?",
+        "I can help you make calls, send messages, or get in touch with your support network. How can I help?",
+        "Your family and caregivers are important. I'm here to help you stay connected. What would you like to do?",
+        "Communication is important for your wellbeing. I can help you reach out to the right people. What do you need?"
+    )
+    _GENERAL_RESPONSE_KEYWORDS = (("help", 0), ("call", 1), ("message", 1), ("family", 2))
+    
+    # Relationships offered for emotional support
+    _EMOTIONAL_RELATIONSHIPS = frozenset({"spouse", "child", "sibling"})
+    
+    __slots__ = (
+        "user_id",
+        "agent_id",
+        "communication_database",
+        "communication_settings",
+        "_active_family",
+        "_priority_family",
+        "_update_subscribers",
+        "_emotional_family",
+        "_active_providers",
+        "_contact_blocks",
+        "_log_ids",
+        "_pending_status_updates",
+        "_status_flush_task",
+        "_status_deliveries",
+        "_request_handlers",
+    )
+    
     def __init__(self, user_id: str):
         """
         Initialize the family communication agent.
@@ -33,11 +223,29 @@ class FamilyCommunicationAgent:
             "family_members": [],
             "caregivers": [],
             "healthcare_providers": [],
-            "recent_calls": [],
-            "messages": [],
+            "recent_calls": deque(maxlen=MAX_COMMUNICATION_LOG),
+            "messages": deque(maxlen=MAX_COMMUNICATION_LOG),
             "communication_preferences": {}
         }
         
+        # Filtered contact views, rebuilt whenever contacts are added
+        self._active_family: List[Dict[str, Any]] = []
+        self._priority_family: List[Dict[str, Any]] = []
+        self._update_subscribers: List[Dict[str, Any]] = []
+        self._emotional_family: List[Dict[str, Any]] = []
+        self._active_providers: List[Dict[str, Any]] = []
+        
+        # Formatted contact bullets by (contact id, bullet style key)
+        self._contact_blocks: Dict[Tuple[str, str], str] = {}
+        
+        # Sequential ids for call and message log entries
+        self._log_ids = itertools.count(1)
+        
+        # Status updates waiting for the next batched send
+        self._pending_status_updates: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = []
+        self._status_flush_task: Optional[asyncio.Task] = None
+        self._status_deliveries: Set[asyncio.Task] = set()
+        
         # Communication settings
         self.communication_settings = {
             "auto_answer_enabled": True,
@@ -47,24 +255,15 @@ class FamilyCommunicationAgent:
             "emergency_contact_priority": True
         }
         
-        # Communication templates
-        self.communication_templates = {
-            "daily_update": {
-                "subject": "Daily Update",
-                "template": "Good {time_of_day}! Here's how {user_name} is doing today..."
-            },
-            "medication_reminder": {
-                "subject": "Medication Reminder",
-                "template": "Reminder: {user_name} needs to take {medication} at {time}"
-            },
-            "appointment_reminder": {
-                "subject": "Appointment Reminder", 
-                "template": "Reminder: {user_name} has an appointment with {doctor} at {time}"
-            },
-            "safety_alert": {
-                "subject": "Safety Alert",
-                "template": "Safety Alert: {user_name} may need assistance. {details}"
-            }
+        # Request handlers by keyword category, None when nothing matched
+        self._request_handlers = {
+            "call": self._handle_call_request,
+            "message": self._handle_message_request,
+            "family": self._handle_family_request,
+            "healthcare": self._handle_healthcare_request,
+            "status": self._handle_status_request,
+            "support": self._handle_support_request,
+            None: self._handle_general_communication_support,
         }
         
         # Initialize with default communication data
@@ -81,35 +280,27 @@ class FamilyCommunicationAgent:
         Returns:
             Response from the family communication agent
         """
+        # One timestamp for the response and anything it logs
+        timestamp = datetime.now().isoformat()
+        
         try:
             content = input_data.get("content", "").lower()
             input_type = input_data.get("type", "text")
             
-            # Determine the type of communication assistance needed
-            if any(keyword in content for keyword in ["call", "phone", "video", "talk to"]):
-                return await self._handle_call_request(content, context)
-            elif any(keyword in content for keyword in ["message", "text", "send", "tell"]):
-                return await self._handle_message_request(content, context)
-            elif any(keyword in content for keyword in ["family", "son", "daughter", "spouse"]):
-                return await self._handle_family_request(content, context)
-            elif any(keyword in content for keyword in ["doctor", "nurse", "medical", "healthcare"]):
-                return await self._handle_healthcare_request(content, context)
-            elif any(keyword in content for keyword in ["update", "how am i", "status", "report"]):
-                return await self._handle_status_request(content, context)
-            elif any(keyword in content for keyword in ["help", "assistance", "support"]):
-                return await self._handle_support_request(content, context)
-            else:
-                return await self._handle_general_communication_support(content, context)
+            # Determine the type of communication assistance needed; empty
+            # input goes straight to general support
+            category = _REQUEST_KEYWORDS.match(content) if content else None
+            return await self._request_handlers[category](content, context, timestamp)
                 
         except Exception as e:
             return {
                 "agent": self.agent_id,
                 "error": True,
                 "message": f"Error in family communication: {str(e)}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
-    async def _handle_call_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_call_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle call requests."""
         # Determine who to call
         call_target = self._identify_call_target(content)
@@ -120,7 +311,7 @@ class FamilyCommunicationAgent:
         if contacts:
             response_text = self._format_call_response(contacts, call_target)
             # Log the call request
-            self._log_call_request(call_target, contacts)
+            self._log_call_request(call_target, contacts, timestamp)
         else:
             response_text = self._format_no_contacts_response(call_target)
         
@@ -130,10 +321,10 @@ class FamilyCommunicationAgent:
             "content": response_text,
             "call_target": call_target,
             "contacts_available": len(contacts),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_message_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_message_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle message requests."""
         # Extract message content and recipient
         message_info = self._extract_message_info(content)
@@ -144,7 +335,7 @@ class FamilyCommunicationAgent:
         if recipients:
             response_text = self._format_message_response(message_info, recipients)
             # Log the message
-            self._log_message(message_info, recipients)
+            self._log_message(message_info, recipients, timestamp)
         else:
             response_text = self._format_no_recipients_response(message_info["recipient_type"])
         
@@ -154,10 +345,10 @@ class FamilyCommunicationAgent:
             "content": response_text,
             "message_info": message_info,
             "recipients_count": len(recipients),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_family_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_family_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle family-related requests."""
         # Get family information
         family_members = self._get_family_members()
@@ -175,10 +366,10 @@ class FamilyCommunicationAgent:
             "type": "family_request",
             "content": response_text,
             "family_members_count": len(family_members),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_healthcare_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_healthcare_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle healthcare provider requests."""
         # Get healthcare providers
         healthcare_providers = self._get_healthcare_providers()
@@ -196,13 +387,13 @@ class FamilyCommunicationAgent:
             "type": "healthcare_request",
             "content": response_text,
             "providers_count": len(healthcare_providers),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_status_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_status_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle status update requests."""
         # Generate status update
-        status_info = self._generate_status_update(context)
+        status_info = self._generate_status_update(context, timestamp)
         
         # Determine who to send update to
         update_recipients = self._get_status_update_recipients()
@@ -218,10 +409,10 @@ class FamilyCommunicationAgent:
             "content": response_text,
             "status_info": status_info,
             "recipients_count": len(update_recipients),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_support_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_support_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle support requests."""
         # Determine support type needed
         support_type = self._identify_support_type(content)
@@ -237,10 +428,10 @@ class FamilyCommunicationAgent:
             "content": response_text,
             "support_type": support_type,
             "contacts_count": len(support_contacts),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_general_communication_support(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_general_communication_support(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle general communication support requests."""
         response_text = self._provide_general_communication_support(content)
         
@@ -248,30 +439,16 @@ class FamilyCommunicationAgent:
             "agent": self.agent_id,
             "type": "general_communication",
             "content": response_text,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
     def _identify_call_target(self, content: str) -> str:
         """Identify who the user wants to call."""
-        if any(keyword in content for keyword in ["family", "son", "daughter", "spouse", "wife", "husband"]):
-            return "family"
-        elif any(keyword in content for keyword in ["doctor", "nurse", "medical"]):
-            return "healthcare"
-        elif any(keyword in content for keyword in ["emergency", "help", "911"]):
-            return "emergency"
-        else:
-            return "general"
+        return _CALL_TARGETS.match(content) or "general"
     
     def _identify_support_type(self, content: str) -> str:
         """Identify the type of support needed."""
-        if any(keyword in content for keyword in ["medical", "health", "doctor"]):
-            return "medical"
-        elif any(keyword in content for keyword in ["emotional", "lonely", "sad"]):
-            return "emotional"
-        elif any(keyword in content for keyword in ["practical", "help", "assistance"]):
-            return "practical"
-        else:
-            return "general"
+        return _SUPPORT_TYPES.match(content) or "general"
     
     def _extract_message_info(self, content: str) -> Dict[str, Any]:
         """Extract message information from content."""
@@ -282,82 +459,87 @@ class FamilyCommunicationAgent:
             "urgency": "normal"
         }
         
-        if any(keyword in content for keyword in ["urgent", "emergency", "important"]):
+        if _URGENT_RE.search(content):
             message_info["urgency"] = "high"
         
-        if any(keyword in content for keyword in ["doctor", "medical", "healthcare"]):
+        if _HEALTHCARE_RECIPIENT_RE.search(content):
             message_info["recipient_type"] = "healthcare"
         
         return message_info
     
+    def _rebuild_contact_views(self):
+        """
+        Recompute the filtered contact lists served to request handlers.
+        
+        Called after any change to the family or healthcare contacts, so the
+        handlers never rescan the database per request.
+        """
+        family_members = self.communication_database["family_members"]
+        providers = self.communication_database["healthcare_providers"]
+        self._contact_blocks.clear()
+        
+        self._active_family = [contact for contact in family_members 
+                               if contact.get("active", True)]
+        self._priority_family = [contact for contact in family_members 
+                                 if contact.get("priority") == "high"]
+        self._update_subscribers = [contact for contact in family_members 
+                                    if contact.get("wants_updates", True)]
+        self._emotional_family = [contact for contact in family_members 
+                                  if contact.get("relationship") in self._EMOTIONAL_RELATIONSHIPS]
+        self._active_providers = [contact for contact in providers 
+                                  if contact.get("active", True)]
+    
     def _get_contacts_for_call(self, call_target: str) -> List[Dict[str, Any]]:
         """Get contacts for calling based on target."""
-        contacts = []
-        
         if call_target == "family":
-            contacts = [contact for contact in self.communication_database["family_members"] 
-                       if contact.get("active", True)]
+            return self._active_family
         elif call_target == "healthcare":
-            contacts = [contact for contact in self.communication_database["healthcare_providers"] 
-                       if contact.get("active", True)]
+            return self._active_providers
         elif call_target == "emergency":
-            contacts = [contact for contact in self.communication_database["family_members"] 
-                       if contact.get("priority") == "high"]
-        
-        return contacts
+            return self._priority_family
+        return []
     
     def _get_message_recipients(self, recipient_type: str) -> List[Dict[str, Any]]:
         """Get message recipients based on type."""
-        recipients = []
-        
         if recipient_type == "family":
-            recipients = [contact for contact in self.communication_database["family_members"] 
-                         if contact.get("active", True)]
+            return self._active_family
         elif recipient_type == "healthcare":
-            recipients = [contact for contact in self.communication_database["healthcare_providers"] 
-                         if contact.get("active", True)]
-        
-        return recipients
+            return self._active_providers
+        return []
     
     def _get_family_members(self) -> List[Dict[str, Any]]:
         """Get family members information."""
-        return [contact for contact in self.communication_database["family_members"] 
-                if contact.get("active", True)]
+        return self._active_family
     
     def _get_healthcare_providers(self) -> List[Dict[str, Any]]:
         """Get healthcare providers information."""
-        return [contact for contact in self.communication_database["healthcare_providers"] 
-                if contact.get("active", True)]
+        return self._active_providers
     
     def _get_status_update_recipients(self) -> List[Dict[str, Any]]:
         """Get recipients for status updates."""
-        return [contact for contact in self.communication_database["family_members"] 
-                if contact.get("wants_updates", True)]
+        return self._update_subscribers
     
     def _get_support_contacts(self, support_type: str) -> List[Dict[str, Any]]:
         """Get support contacts based on type."""
-        contacts = []
-        
         if support_type == "medical":
-            contacts = [contact for contact in self.communication_database["healthcare_providers"] 
-                       if contact.get("active", True)]
+            return self._active_providers
         elif support_type == "emotional":
-            contacts = [contact for contact in self.communication_database["family_members"] 
-                       if contact.get("relationship") in ["spouse", "child", "sibling"]]
-        else:
-            contacts = [contact for contact in self.communication_database["family_members"] 
-                       if contact.get("active", True)]
-        
-        return contacts
+            return self._emotional_family
+        return self._active_family
     
-    def _generate_status_update(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate a status update based on current context."""
-        current_time = datetime.now()
+    def _generate_status_update(self, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+        """
+        Generate a status update based on current context.
         
+        context["recent_interactions"] is normally a bounded deque, so the
+        last 3 interactions are read from its tail without copying it.
+        """
+        recent_interactions = context.get("recent_interactions") or ()
         status_info = {
-            "timestamp": current_time.isoformat(),
+            "timestamp": timestamp,
             "user_mood": context.get("mood", "neutral"),
-            "recent_activities": context.get("recent_interactions", [])[-3:],  # Last 3 interactions
+            "recent_activities": list(itertools.islice(  # Last 3 interactions
+                reversed(recent_interactions), 3))[::-1],
             "safety_status": "safe",
             "medication_status": "on_track",
             "overall_wellbeing": "good"
@@ -365,23 +547,43 @@ class FamilyCommunicationAgent:
         
         return status_info
     
+    def _contact_block(self, contact: Mapping[str, Any], style: _BulletStyle) -> str:
+        """
+        Return a contact's formatted bullet, rendering it on first use.
+        
+        Contacts rarely change, so bullets are kept by contact id until
+        _rebuild_contact_views clears them. Contacts without an id are
+        rendered every time.
+        """
+        contact_id = contact.get("id")
+        if contact_id is None:
+            return _render_bullet(contact, style)
+        key = (contact_id, style.key)
+        block = self._contact_blocks.get(key)
+        if block is None:
+            block = self._contact_blocks[key] = _render_bullet(contact, style)
+        return block
+    
+    def _render_contact_list(self, header: Sequence[str], contacts: Sequence[Mapping[str, Any]], style: _BulletStyle, footer: str = "") -> str:
+        """Join header lines, one bullet per contact and a footer, each bullet followed by a blank line."""
+        lines = list(header)
+        for contact in contacts:
+            lines.append(self._contact_block(contact, style))
+            lines.append("")
+        lines.append(footer)
+        return "\n".join(lines)
+    
     def _format_call_response(self, contacts: List[Dict[str, Any]], call_target: str) -> str:
         """Format call response message."""
         if not contacts:
             return f"I don't have contact information for {call_target} right now."
         
-        response = f"📞 CALLING {call_target.upper()} 📞\n\n"
-        response += "I can help you call:\n\n"
-        
-        for contact in contacts[:3]:  # Limit to 3 contacts
-            response += f"• {contact.get('name', 'Contact')}\n"
-            response += f"  Phone: {contact.get('phone', 'No phone')}\n"
-            if contact.get('relationship'):
-                response += f"  Relationship: {contact['relationship']}\n"
-            response += "\n"
-        
-        response += "I'm initiating the call now."
-        return response
+        return self._render_contact_list(
+            (f"📞 CALLING {call_target.upper()} 📞", "", "I can help you call:", ""),
+            contacts[:3],  # Limit to 3 contacts
+            _CALL_STYLE,
+            "I'm initiating the call now."
+        )
     
     def _format_no_contacts_response(self, call_target: str) -> str:
         """Format no contacts response message."""
@@ -390,17 +592,20 @@ class FamilyCommunicationAgent:
     def _format_message_response(self, message_info: Dict[str, Any], recipients: List[Dict[str, Any]]) -> str:
         """Format message response message."""
         if not recipients:
-            return "I don't have contact information for sending messages right now."
-        
-        response = "📱 SENDING MESSAGE 📱\n\n"
-        response += f"Message: {message_info['content']}\n\n"
-        response += f"Sending to {len(recipients)} recipient(s):\n"
-        
-        for recipient in recipients[:3]:  # Limit to 3 recipients
-            response += f"• {recipient.get('name', 'Contact')}\n"
-        
-        response += "\nMessage sent successfully."
-        return response
+            return self._NO_MESSAGE_RECIPIENTS
+        
+        lines = [
+            "📱 SENDING MESSAGE 📱",
+            "",
+            f"Message: {message_info['content']}",
+            "",
+            f"Sending to {len(recipients)} recipient(s):"
+        ]
+        # Limit to 3 recipients
+        lines.extend(f"• {recipient.get('name', 'Contact')}" for recipient in recipients[:3])
+        lines.append("")
+        lines.append("Message sent successfully.")
+        return "\n".join(lines)
     
     def _format_no_recipients_response(self, recipient_type: str) -> str:
         """Format no recipients response message."""
@@ -409,160 +614,106 @@ class FamilyCommunicationAgent:
     def _format_family_info(self, family_members: List[Dict[str, Any]]) -> str:
         """Format family information message."""
         if not family_members:
-            return "I don't have family information available right now."
-        
-        response = "👨‍👩‍👧‍👦 YOUR FAMILY 👨‍👩‍👧‍👦\n\n"
+            return self._NO_FAMILY_INFO
         
-        for member in family_members:
-            response += f"• {member.get('name', 'Family Member')}\n"
-            response += f"  Relationship: {member.get('relationship', 'Unknown')}\n"
-            if member.get('phone'):
-                response += f"  Phone: {member['phone']}\n"
-            if member.get('location'):
-                response += f"  Location: {member['location']}\n"
-            response += "\n"
-        
-        return response
+        return self._render_contact_list(("👨‍👩‍👧‍👦 YOUR FAMILY 👨‍👩‍👧‍👦", ""), family_members, _FAMILY_INFO_STYLE)
     
     def _format_family_call_options(self, family_members: List[Dict[str, Any]]) -> str:
         """Format family call options message."""
         if not family_members:
-            return "I don't have family contact information available right now."
-        
-        response = "📞 FAMILY CALL OPTIONS 📞\n\n"
-        response += "I can help you call:\n\n"
+            return self._NO_FAMILY_CONTACTS
         
-        for member in family_members:
-            response += f"• {member.get('name', 'Family Member')} ({member.get('relationship', 'Unknown')})\n"
-            if member.get('phone'):
-                response += f"  Phone: {member['phone']}\n"
-            response += "\n"
-        
-        response += "Who would you like to call?"
-        return response
+        return self._render_contact_list(
+            ("📞 FAMILY CALL OPTIONS 📞", "", "I can help you call:", ""),
+            family_members,
+            _FAMILY_CALL_STYLE,
+            "Who would you like to call?"
+        )
     
     def _format_general_family_response(self, family_members: List[Dict[str, Any]]) -> str:
         """Format general family response message."""
         if not family_members:
-            return "I don't have family information available right now."
+            return self._NO_FAMILY_INFO
         
         return f"Your family includes {len(family_members)} members. I can help you contact them or get more information about them."
     
     def _format_healthcare_contact_options(self, providers: List[Dict[str, Any]]) -> str:
         """Format healthcare contact options message."""
         if not providers:
-            return "I don't have healthcare provider information available right now."
-        
-        response = "🏥 HEALTHCARE CONTACTS 🏥\n\n"
-        response += "I can help you contact:\n\n"
-        
-        for provider in providers:
-            response += f"• {provider.get('name', 'Healthcare Provider')}\n"
-            response += f"  Type: {provider.get('type', 'Unknown')}\n"
-            if provider.get('phone'):
-                response += f"  Phone: {provider['phone']}\n"
-            response += "\n"
+            return self._NO_PROVIDER_INFO
         
-        response += "Who would you like to contact?"
-        return response
+        return self._render_contact_list(
+            ("🏥 HEALTHCARE CONTACTS 🏥", "", "I can help you contact:", ""),
+            providers,
+            _HEALTHCARE_CONTACT_STYLE,
+            "Who would you like to contact?"
+        )
     
     def _format_appointment_info(self, providers: List[Dict[str, Any]]) -> str:
         """Format appointment information message."""
         if not providers:
-            return "I don't have healthcare provider information available right now."
-        
-        response = "📅 APPOINTMENT INFORMATION 📅\n\n"
-        response += "Your healthcare providers:\n\n"
-        
-        for provider in providers:
-            response += f"• {provider.get('name', 'Healthcare Provider')}\n"
-            if provider.get('next_appointment'):
-                response += f"  Next appointment: {provider['next_appointment']}\n"
-            response += "\n"
+            return self._NO_PROVIDER_INFO
         
-        return response
+        return self._render_contact_list(
+            ("📅 APPOINTMENT INFORMATION 📅", "", "Your healthcare providers:", ""),
+            providers,
+            _APPOINTMENT_STYLE
+        )
     
     def _format_healthcare_info(self, providers: List[Dict[str, Any]]) -> str:
         """Format healthcare information message."""
         if not providers:
-            return "I don't have healthcare provider information available right now."
+            return self._NO_PROVIDER_INFO
         
-        response = "🏥 YOUR HEALTHCARE TEAM 🏥\n\n"
-        
-        for provider in providers:
-            response += f"• {provider.get('name', 'Healthcare Provider')}\n"
-            response += f"  Type: {provider.get('type', 'Unknown')}\n"
-            if provider.get('specialty'):
-                response += f"  Specialty: {provider['specialty']}\n"
-            response += "\n"
-        
-        return response
+        return self._render_contact_list(("🏥 YOUR HEALTHCARE TEAM 🏥", ""), providers, _HEALTHCARE_INFO_STYLE)
     
     def _format_status_response(self, status_info: Dict[str, Any], recipients: List[Dict[str, Any]]) -> str:
         """Format status response message."""
-        response = "📊 STATUS UPDATE 📊\n\n"
-        response += f"Current status: {status_info.get('overall_wellbeing', 'Unknown')}\n"
-        response += f"Mood: {status_info.get('user_mood', 'Unknown')}\n"
-        response += f"Safety status: {status_info.get('safety_status', 'Unknown')}\n"
-        response += f"Medication status: {status_info.get('medication_status', 'Unknown')}\n\n"
-        response += f"Status update sent to {len(recipients)} family members."
-        
-        return response
+        return (
+            "📊 STATUS UPDATE 📊\n\n"
+            f"Current status: {status_info.get('overall_wellbeing', 'Unknown')}\n"
+            f"Mood: {status_info.get('user_mood', 'Unknown')}\n"
+            f"Safety status: {status_info.get('safety_status', 'Unknown')}\n"
+            f"Medication status: {status_info.get('medication_status', 'Unknown')}\n\n"
+            f"Status update sent to {len(recipients)} family members."
+        )
     
     def _format_support_response(self, support_contacts: List[Dict[str, Any]], support_type: str) -> str:
         """Format support response message."""
         if not support_contacts:
             return f"I don't have {support_type} support contacts available right now."
         
-        response = f"🤝 {support_type.upper()} SUPPORT 🤝\n\n"
-        response += "I can connect you with:\n\n"
-        
-        for contact in support_contacts:
-            response += f"• {contact.get('name', 'Support Contact')}\n"
-            if contact.get('phone'):
-                response += f"  Phone: {contact['phone']}\n"
-            if contact.get('specialty'):
-                response += f"  Specialty: {contact['specialty']}\n"
-            response += "\n"
-        
-        response += "Who would you like to contact for support?"
-        return response
+        return self._render_contact_list(
+            (f"🤝 {support_type.upper()} SUPPORT 🤝", "", "I can connect you with:", ""),
+            support_contacts,
+            _SUPPORT_STYLE,
+            "Who would you like to contact for support?"
+        )
     
     def _provide_general_communication_support(self, content: str) -> str:
         """Provide general communication support."""
-        responses = [
-            "I'm here to help you communicate with your family and caregivers. What do you need?",
-            "I can help you make calls, send messages, or get in touch with your support network. How can I help?",
-            "Your family and caregivers are important. I'm here to help you stay connected. What would you like to do?",
-            "Communication is important for your wellbeing. I can help you reach out to the right people. What do you need?"
-        ]
-        
         # Simple response selection based on content
-        if "help" in content:
-            return responses[0]
-        elif "call" in content or "message" in content:
-            return responses[1]
-        elif "family" in content:
-            return responses[2]
-        else:
-            return responses[3]
+        for keyword, index in self._GENERAL_RESPONSE_KEYWORDS:
+            if keyword in content:
+                return self._GENERAL_RESPONSES[index]
+        return self._GENERAL_RESPONSES[3]
     
-    def _log_call_request(self, call_target: str, contacts: List[Dict[str, Any]]):
+    def _log_call_request(self, call_target: str, contacts: List[Dict[str, Any]], timestamp: str):
         """Log call request."""
         call_log = {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.now().isoformat(),
+            "id": f"log-{next(self._log_ids)}",
+            "timestamp": timestamp,
             "target": call_target,
             "contacts_requested": len(contacts),
             "status": "initiated"
         }
         self.communication_database["recent_calls"].append(call_log)
     
-    def _log_message(self, message_info: Dict[str, Any], recipients: List[Dict[str, Any]]):
+    def _log_message(self, message_info: Dict[str, Any], recipients: List[Dict[str, Any]], timestamp: str):
         """Log message."""
         message_log = {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.now().isoformat(),
+            "id": f"log-{next(self._log_ids)}",
+            "timestamp": timestamp,
             "content": message_info["content"],
             "recipients": len(recipients),
             "urgency": message_info["urgency"]
@@ -570,71 +721,85 @@ class FamilyCommunicationAgent:
         self.communication_database["messages"].append(message_log)
     
     async def _send_status_update(self, status_info: Dict[str, Any], recipients: List[Dict[str, Any]]):
-        """Send status update to family members."""
-        # In a real system, this would send actual notifications
-        print(f"📊 Sending status update to {len(recipients)} family members")
-        print(f"Status: {status_info.get('overall_wellbeing', 'Unknown')}")
-        print(f"Mood: {status_info.get('user_mood', 'Unknown')}")
+        """Queue a status update for family members, to be sent with its batch."""
+        self._pending_status_updates.append((status_info, recipients))
+        if len(self._pending_status_updates) >= STATUS_BATCH_SIZE:
+            self._flush_status_updates()
+        elif self._status_flush_task is None:
+            self._status_flush_task = asyncio.get_running_loop().create_task(self._flush_status_updates_later())
+    
+    async def _flush_status_updates_later(self):
+        """Send queued status updates once the batching window closes."""
+        await asyncio.sleep(STATUS_FLUSH_DELAY)
+        self._flush_status_updates()
+    
+    def _flush_status_updates(self):
+        """Send all queued status updates as one notification batch."""
+        updates, self._pending_status_updates = self._pending_status_updates, []
+        timer = self._status_flush_task
+        if timer is not None and timer is not asyncio.current_task():
+            # A full batch flushed early; the pending timer must not flush the next one
+            timer.cancel()
+        self._status_flush_task = None
+        if not updates:
+            return
+        
+        # The batch is logged as one record rather than a print per update
+        logger.info(
+            "📊 Sending %d status update(s):\n%s",
+            len(updates),
+            "\n".join(
+                f"To {len(recipients)} family members - "
+                f"Status: {status_info.get('overall_wellbeing', 'Unknown')}, "
+                f"Mood: {status_info.get('user_mood', 'Unknown')}"
+                for status_info, recipients in updates
+            )
+        )
+        
+        if any(recipients for _, recipients in updates):
+            task = asyncio.get_running_loop().create_task(self._deliver_status_updates(updates))
+            self._status_deliveries.add(task)
+            task.add_done_callback(self._status_deliveries.discard)
+    
+    async def _deliver_status_updates(self, updates: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]):
+        """Notify every recipient in a batch concurrently, at most STATUS_SEND_CONCURRENCY at a time."""
+        semaphore = asyncio.Semaphore(STATUS_SEND_CONCURRENCY)
+        
+        async def notify(recipient: Dict[str, Any], status_info: Dict[str, Any]):
+            async with semaphore:
+                await self._notify_recipient(recipient, status_info)
+        
+        results = await asyncio.gather(
+            *(notify(recipient, status_info) for status_info, recipients in updates for recipient in recipients),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Failed to deliver status update: %s", result)
+    
+    async def _notify_recipient(self, recipient: Dict[str, Any], status_info: Dict[str, Any]):
+        """Deliver one status update to one family member."""
+        # In a real system, this would send an SMS, email or push notification
+        logger.debug("Status update delivered to %s", recipient.get("name", "Contact"))
     
     def _initialize_default_communication_data(self):
         """Initialize default communication data."""
-        # Add default family members
-        self.communication_database["family_members"] = [
-            {
-                "id": "family_001",
-                "name": "Sarah (Daughter)",
-                "relationship": "daughter",
-                "phone": "(555) 123-4567",
-                "email": "sarah@email.com",
-                "location": "New York",
-                "priority": "high",
-                "wants_updates": True,
-                "active": True
-            },
-            {
-                "id": "family_002",
-                "name": "John (Son)",
-                "relationship": "son",
-                "phone": "(555) 234-5678",
-                "email": "john@email.com",
-                "location": "California",
-                "priority": "high",
-                "wants_updates": True,
-                "active": True
-            }
-        ]
-        
-        # Add default healthcare providers
-        self.communication_database["healthcare_providers"] = [
-            {
-                "id": "health_001",
-                "name": "Dr. Smith",
-                "type": "primary_care",
-                "specialty": "Geriatrics",
-                "phone": "(555) 987-6543",
-                "email": "dr.smith@clinic.com",
-                "next_appointment": "Next Tuesday at 2:00 PM",
-                "active": True
-            },
-            {
-                "id": "health_002",
-                "name": "Nurse Johnson",
-                "type": "nurse",
-                "specialty": "Home Care",
-                "phone": "(555) 876-5432",
-                "email": "nurse.johnson@clinic.com",
-                "active": True
-            }
-        ]
+        # The default contacts are shared, read-only records; only the
+        # lists holding them belong to this agent
+        self.communication_database["family_members"] = list(_DEFAULT_FAMILY)
+        self.communication_database["healthcare_providers"] = list(_DEFAULT_PROVIDERS)
+        self._rebuild_contact_views()
     
     def add_family_member(self, member_data: Dict[str, Any]):
         """Add a new family member."""
         member_data["id"] = str(uuid.uuid4())
         member_data["active"] = True
         self.communication_database["family_members"].append(member_data)
+        self._rebuild_contact_views()
     
     def add_healthcare_provider(self, provider_data: Dict[str, Any]):
         """Add a new healthcare provider."""
         provider_data["id"] = str(uuid.uuid4())
         provider_data["active"] = True
         self.communication_database["healthcare_providers"].append(provider_data)
+        self._rebuild_contact_views()
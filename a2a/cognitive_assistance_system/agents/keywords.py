@@ -0,0 +1,50 @@
+"""
+Keyword Matching
+
+Shared keyword routing for the specialized agents. Each table holds keyword
+categories in priority order and classifies content with one regex scan.
+"""
+
+import re
+from typing import Optional, Sequence, Tuple
+
+
+class KeywordTable:
+    """
+    Keyword categories in priority order, matched with a single scan.
+
+    Matching keeps the semantics of a chain of `any(keyword in content ...)`
+    checks: keywords match as substrings, and the first category in the
+    table wins regardless of where in the content its keyword appears.
+    """
+
+    __slots__ = ("names", "pattern")
+
+    def __init__(self, categories: Sequence[Tuple[str, Sequence[str]]], ignore_case: bool = False):
+        """
+        Compile the keyword categories into one pattern.
+
+        Args:
+            categories: (name, keywords) pairs, highest priority first
+            ignore_case: Match regardless of case, so content need not be
+                lowercased first
+        """
+        self.names = tuple(name for name, _ in categories)
+
+        # Each category is a group numbered in priority order. The lookahead
+        # tries every position so overlapping keywords are still found.
+        groups = "|".join(
+            "(" + "|".join(re.escape(keyword) for keyword in keywords) + ")"
+            for _, keywords in categories
+        )
+        self.pattern = re.compile(f"(?=(?:{groups}))", re.IGNORECASE if ignore_case else 0)
+
+    def match(self, content: str) -> Optional[str]:
+        """Return the highest-priority category with a keyword in content, if any."""
+        best = 0
+        for match in self.pattern.finditer(content):
+            if best == 0 or match.lastindex < best:
+                best = match.lastindex
+                if best == 1:
+                    break
+        return self.names[best - 1] if best else None
@@ -5,11 +5,222 @@ This agent specializes in helping individuals with Alzheimer's disease
 with memory-related tasks, reminiscence therapy, and cognitive support.
 """
 
-import json
+import os
 import uuid
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-import asyncio
+from typing import Dict, List, Mapping, Optional, Any, Sequence, Tuple, Union
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+from .keywords import KeywordTable
+
+# Request categories in dispatch priority order
+_REQUEST_KEYWORDS = KeywordTable((
+    ("memory_prompt", ("remember", "forgot")),
+    ("fact_recall", ("who is", "what is")),
+    ("reminiscence", ("tell me about", "story")),
+    ("cognitive_exercise", ("exercise", "game")),
+), ignore_case=True)
+
+_MEMORY_TYPES = KeywordTable((
+    ("family", ("family", "mother", "father", "son", "daughter", "spouse")),
+    ("personal", ("childhood", "school", "work", "marriage")),
+), ignore_case=True)
+
+_FACT_TYPES = KeywordTable((
+    ("person", ("who is", "who was", "person")),
+    ("place", ("where is", "place", "location")),
+    ("event", ("when did", "what happened", "event")),
+), ignore_case=True)
+
+# Users tend to repeat the same phrasings, so each agent memoizes these
+# classifications (see MemoryAssistanceAgent.__init__). The caches hold user
+# text, so they live and die with the agent rather than the process.
+CLASSIFICATION_CACHE_SIZE = 256
+
+
+def _identify_memory_type(content: str) -> str:
+    """Identify the type of memory being requested."""
+    return _MEMORY_TYPES.match(content) or "general"
+
+
+def _identify_fact_type(content: str) -> str:
+    """Identify the type of fact being requested."""
+    return _FACT_TYPES.match(content) or "general"
+
+
+_ENCOURAGEMENT_KEYWORDS = KeywordTable((
+    ("help", ("help",)),
+    ("forgot", ("forgot",)),
+    ("remember", ("remember",)),
+), ignore_case=True)
+
+
+@dataclass(slots=True)
+class Memory:
+    """A personal memory row in the memory database."""
+    type: str = ""
+    description: str = ""
+    date: str = ""
+    importance: str = "medium"
+    id: str = ""
+    created_at: str = ""
+    # Caller-supplied fields without a column of their own
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class FamilyMember:
+    """A family member row in the memory database."""
+    name: str
+    relationship: str = ""
+    age: str = ""
+    location: str = ""
+    contact: str = ""
+    id: str = ""
+    # Caller-supplied fields without a column of their own
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+def _apply_fields(row: Any, data: Mapping[str, Any]):
+    """Set each key in data on row, keeping unknown keys in row.extra."""
+    for key, value in data.items():
+        if key != "extra" and key in _ROW_COLUMNS[type(row)]:
+            setattr(row, key, value)
+        else:
+            row.extra[key] = value
+
+
+def _memory_from(data: Union[Memory, Mapping[str, Any]]) -> Memory:
+    """Build a Memory row from a row or a field mapping."""
+    if isinstance(data, Memory):
+        return data
+    memory = Memory()
+    _apply_fields(memory, data)
+    return memory
+
+
+def _family_member_from(data: Union[FamilyMember, Mapping[str, Any]]) -> FamilyMember:
+    """Build a FamilyMember row from a row or a field mapping."""
+    if isinstance(data, FamilyMember):
+        return data
+    member = FamilyMember(data["name"])
+    _apply_fields(member, data)
+    return member
+
+
+@dataclass(slots=True)
+class Place:
+    """An important place row in the memory database."""
+    name: str
+    address: str
+    description: str
+    directions: str = ""
+
+
+@dataclass(slots=True)
+class Event:
+    """A life event row in the memory database."""
+    event: str
+    date: str
+    year: str
+    description: str
+
+
+@dataclass(slots=True, frozen=True)
+class Exercise:
+    """A cognitive exercise offered to the user."""
+    type: str
+    instructions: str
+    prompt: str
+    words: Tuple[str, ...] = ()
+
+
+# Column names of the rows built from caller mappings
+_ROW_COLUMNS = {
+    row_type: frozenset(column.name for column in fields(row_type))
+    for row_type in (Memory, FamilyMember)
+}
+
+
+# Sample recall data, shared read-only by every agent until the lookups
+# are backed by a real memory database
+_SAMPLE_PERSONAL_MEMORIES = (
+    Memory(
+        id="mem_001",
+        type="childhood",
+        description="Playing in the backyard with siblings",
+        date="1950s",
+        importance="high"
+    ),
+    Memory(
+        id="mem_002",
+        type="school",
+        description="First day of school",
+        date="1955",
+        importance="medium"
+    )
+)
+
+_SAMPLE_FAMILY = (
+    FamilyMember(
+        name="Sarah",
+        relationship="daughter",
+        age="45",
+        location="New York",
+        contact="sarah@email.com"
+    ),
+    FamilyMember(
+        name="John",
+        relationship="son",
+        age="42",
+        location="California",
+        contact="john@email.com"
+    )
+)
+
+_SAMPLE_PERSON = MappingProxyType({
+    "name": "Sarah",
+    "relationship": "daughter",
+    "recent_contact": "Last week",
+    "important_notes": "Lives in New York, works as a teacher"
+})
+
+_SAMPLE_PLACE = Place(
+    name="Home",
+    address="123 Main Street",
+    description="Your house where you've lived for 30 years",
+    directions="Turn left at the corner, go two blocks"
+)
+
+_SAMPLE_EVENT = Event(
+    event="Wedding Anniversary",
+    date="June 15th",
+    year="1965",
+    description="Your 50th wedding anniversary celebration"
+)
+
+_SAMPLE_REMINISCENCE_PROMPTS = (
+    MappingProxyType({
+        "prompt": "Tell me about your favorite childhood toy",
+        "category": "childhood",
+        "difficulty": "easy"
+    }),
+    MappingProxyType({
+        "prompt": "What was your first job like?",
+        "category": "work",
+        "difficulty": "medium"
+    })
+)
+
+_SAMPLE_EXERCISE = Exercise(
+    type="word_association",
+    instructions="Take your time, there are no wrong answers",
+    prompt="I'll say a word, and you tell me the first thing that comes to mind",
+    words=("home", "family", "love", "happy")
+)
+
 
 class MemoryAssistanceAgent:
     """
@@ -17,6 +228,30 @@ class MemoryAssistanceAgent:
     Provides reminiscence therapy, memory prompts, and cognitive exercises.
     """
     
+    # Encouraging replies for general memory support
+    _ENCOURAGING_RESPONSES = MappingProxyType({
+        "help": "I'm here to help you remember. Take your time, there's no rush.",
+        "forgot": "Memory can be tricky sometimes, but we'll work through this together.",
+        "remember": "It's okay if you don't remember right away. I'm patient and here to help.",
+        None: "Let's take this one step at a time. What would you like to remember?"
+    })
+    
+    # Default reminiscence prompts
+    _DEFAULT_REMINISCENCE_PROMPTS = (
+        "Tell me about your favorite childhood memory",
+        "What was your first job like?",
+        "Tell me about your wedding day",
+        "What was your favorite holiday tradition?",
+        "Tell me about your children when they were young"
+    )
+    
+    # Default word association exercises
+    _DEFAULT_WORD_ASSOCIATIONS = (
+        MappingProxyType({"word": "home", "associations": ("family", "comfort", "love")}),
+        MappingProxyType({"word": "spring", "associations": ("flowers", "renewal", "growth")}),
+        MappingProxyType({"word": "music", "associations": ("dancing", "singing", "joy")})
+    )
+    
     def __init__(self, user_id: str):
         """
         Initialize the memory assistance agent.
@@ -37,15 +272,30 @@ class MemoryAssistanceAgent:
             "preferences": {}
         }
         
-        # Cognitive exercises
+        # Lookup indexes over memory_database rows
+        self._family_by_name: Dict[str, FamilyMember] = {}
+        self._memories_by_id: Dict[str, Memory] = {}
+        
+        # Cognitive exercises; the default prompts and word associations are
+        # shared read-only by every agent
         self.cognitive_exercises = {
-            "word_association": [],
+            "word_association": self._DEFAULT_WORD_ASSOCIATIONS,
             "memory_games": [],
-            "reminiscence_prompts": []
+            "reminiscence_prompts": self._DEFAULT_REMINISCENCE_PROMPTS
         }
         
-        # Initialize with default memories and exercises
-        self._initialize_default_content()
+        # This user's memoized classifications
+        self._identify_memory_type = lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)(_identify_memory_type)
+        self._identify_fact_type = lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)(_identify_fact_type)
+        
+        # Request handlers by keyword category, None when nothing matched
+        self._request_handlers = {
+            "memory_prompt": self._handle_memory_prompt,
+            "fact_recall": self._handle_fact_recall,
+            "reminiscence": self._handle_reminiscence,
+            "cognitive_exercise": self._handle_cognitive_exercise,
+            None: self._handle_general_memory_support,
+        }
     
     async def process_request(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -58,34 +308,31 @@ class MemoryAssistanceAgent:
         Returns:
             Response from the memory assistance agent
         """
+        # One timestamp for the response
+        timestamp = datetime.now().isoformat()
+        
         try:
-            content = input_data.get("content", "").lower()
+            # Keyword tables ignore case, so content is not lowercased
+            content = input_data.get("content", "")
             input_type = input_data.get("type", "text")
             
             # Determine the type of memory assistance needed
-            if "remember" in content or "forgot" in content:
-                return await self._handle_memory_prompt(content, context)
-            elif "who is" in content or "what is" in content:
-                return await self._handle_fact_recall(content, context)
-            elif "tell me about" in content or "story" in content:
-                return await self._handle_reminiscence(content, context)
-            elif "exercise" in content or "game" in content:
-                return await self._handle_cognitive_exercise(content, context)
-            else:
-                return await self._handle_general_memory_support(content, context)
+            category = _REQUEST_KEYWORDS.match(content)
+            return await self._request_handlers[category](content, context, timestamp)
                 
         except Exception as e:
             return {
                 "agent": self.agent_id,
                 "error": True,
                 "message": f"Error in memory assistance: {str(e)}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
-    async def _handle_memory_prompt(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_memory_prompt(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle requests for memory prompts and reminders."""
         # Extract key information from the request
         memory_type = self._identify_memory_type(content)
+        memories: Sequence[Memory] = ()
         
         if memory_type == "personal":
             memories = self._get_personal_memories(content)
@@ -94,17 +341,17 @@ class MemoryAssistanceAgent:
             family_info = self._get_family_information(content)
             response_text = self._format_family_response(family_info)
         else:
-            response_text = self._provide_general_memory_support(content)
+            response_text = self._provide_encouraging_memory_support(content)
         
         return {
             "agent": self.agent_id,
             "type": "memory_prompt",
             "content": response_text,
-            "memories_retrieved": len(memories) if 'memories' in locals() else 0,
-            "timestamp": datetime.now().isoformat()
+            "memories_retrieved": len(memories),
+            "timestamp": timestamp
         }
     
-    async def _handle_fact_recall(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_fact_recall(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle requests for specific fact recall."""
         # Identify what information is being requested
         fact_type = self._identify_fact_type(content)
@@ -126,10 +373,10 @@ class MemoryAssistanceAgent:
             "type": "fact_recall",
             "content": response_text,
             "fact_type": fact_type,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_reminiscence(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_reminiscence(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle reminiscence therapy requests."""
         # Select appropriate reminiscence prompts
         prompts = self._get_reminiscence_prompts(content)
@@ -141,10 +388,10 @@ class MemoryAssistanceAgent:
             "type": "reminiscence",
             "content": response_text,
             "prompts_provided": len(prompts),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_cognitive_exercise(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_cognitive_exercise(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle cognitive exercise requests."""
         # Select appropriate cognitive exercise
         exercise = self._get_cognitive_exercise(content)
@@ -155,11 +402,11 @@ class MemoryAssistanceAgent:
             "agent": self.agent_id,
             "type": "cognitive_exercise",
             "content": response_text,
-            "exercise_type": exercise.get("type", "unknown"),
-            "timestamp": datetime.now().isoformat()
+            "exercise_type": exercise.type,
+            "timestamp": timestamp
         }
     
-    async def _handle_general_memory_support(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_general_memory_support(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle general memory support requests."""
         # Provide gentle memory support and encouragement
         response_text = self._provide_encouraging_memory_support(content)
@@ -168,226 +415,164 @@ class MemoryAssistanceAgent:
             "agent": self.agent_id,
             "type": "general_support",
             "content": response_text,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    def _identify_memory_type(self, content: str) -> str:
-        """Identify the type of memory being requested."""
-        if any(word in content for word in ["family", "mother", "father", "son", "daughter", "spouse"]):
-            return "family"
-        elif any(word in content for word in ["childhood", "school", "work", "marriage"]):
-            return "personal"
-        else:
-            return "general"
-    
-    def _identify_fact_type(self, content: str) -> str:
-        """Identify the type of fact being requested."""
-        if any(word in content for word in ["who is", "who was", "person"]):
-            return "person"
-        elif any(word in content for word in ["where is", "place", "location"]):
-            return "place"
-        elif any(word in content for word in ["when did", "what happened", "event"]):
-            return "event"
-        else:
-            return "general"
-    
-    def _get_personal_memories(self, content: str) -> List[Dict[str, Any]]:
+    def _get_personal_memories(self, content: str) -> Sequence[Memory]:
         """Retrieve relevant personal memories."""
         # This would typically query a database
         # For now, return sample memories
-        return [
-            {
-                "id": "mem_001",
-                "type": "childhood",
-                "description": "Playing in the backyard with siblings",
-                "date": "1950s",
-                "importance": "high"
-            },
-            {
-                "id": "mem_002", 
-                "type": "school",
-                "description": "First day of school",
-                "date": "1955",
-                "importance": "medium"
-            }
-        ]
+        return _SAMPLE_PERSONAL_MEMORIES
     
-    def _get_family_information(self, content: str) -> List[Dict[str, Any]]:
+    def _get_family_information(self, content: str) -> Sequence[FamilyMember]:
         """Retrieve family member information."""
-        return [
-            {
-                "name": "Sarah",
-                "relationship": "daughter",
-                "age": "45",
-                "location": "New York",
-                "contact": "sarah@email.com"
-            },
-            {
-                "name": "John",
-                "relationship": "son", 
-                "age": "42",
-                "location": "California",
-                "contact": "john@email.com"
-            }
-        ]
+        return _SAMPLE_FAMILY
     
-    def _get_person_information(self, content: str) -> Dict[str, Any]:
+    def _get_person_information(self, content: str) -> Mapping[str, Any]:
         """Get information about a specific person."""
         # Extract person name from content
         # This would typically query a database
-        return {
-            "name": "Sarah",
-            "relationship": "daughter",
-            "recent_contact": "Last week",
-            "important_notes": "Lives in New York, works as a teacher"
-        }
+        return _SAMPLE_PERSON
     
-    def _get_place_information(self, content: str) -> Dict[str, Any]:
+    def _get_place_information(self, content: str) -> Place:
         """Get information about a specific place."""
-        return {
-            "name": "Home",
-            "address": "123 Main Street",
-            "description": "Your house where you've lived for 30 years",
-            "directions": "Turn left at the corner, go two blocks"
-        }
+        return _SAMPLE_PLACE
     
-    def _get_event_information(self, content: str) -> Dict[str, Any]:
+    def _get_event_information(self, content: str) -> Event:
         """Get information about a specific event."""
-        return {
-            "event": "Wedding Anniversary",
-            "date": "June 15th",
-            "year": "1965",
-            "description": "Your 50th wedding anniversary celebration"
-        }
+        return _SAMPLE_EVENT
     
-    def _get_reminiscence_prompts(self, content: str) -> List[Dict[str, Any]]:
+    def _get_reminiscence_prompts(self, content: str) -> Sequence[Mapping[str, Any]]:
         """Get reminiscence therapy prompts."""
-        return [
-            {
-                "prompt": "Tell me about your favorite childhood toy",
-                "category": "childhood",
-                "difficulty": "easy"
-            },
-            {
-                "prompt": "What was your first job like?",
-                "category": "work",
-                "difficulty": "medium"
-            }
-        ]
+        return _SAMPLE_REMINISCENCE_PROMPTS
     
-    def _get_cognitive_exercise(self, content: str) -> Dict[str, Any]:
+    def _get_cognitive_exercise(self, content: str) -> Exercise:
         """Get a cognitive exercise."""
-        return {
-            "type": "word_association",
-            "exercise": "I'll say a word, and you tell me the first thing that comes to mind",
-            "words": ["home", "family", "love", "happy"],
-            "instructions": "Take your time, there are no wrong answers"
-        }
+        return _SAMPLE_EXERCISE
     
-    def _format_memory_response(self, memories: List[Dict[str, Any]], memory_type: str) -> str:
+    def _format_memory_response(self, memories: Sequence[Memory], memory_type: str) -> str:
         """Format memory response for user."""
         if not memories:
             return "I'm here to help you remember. Take your time, and I'll be patient with you."
         
-        response = f"I found some {memory_type} memories for you:\n\n"
-        for memory in memories[:3]:  # Limit to 3 memories
-            response += f"• {memory['description']} ({memory['date']})\n"
-        
-        response += "\nWould you like to tell me more about any of these?"
-        return response
+        lines = [f"I found some {memory_type} memories for you:", ""]
+        # Limit to 3 memories
+        lines.extend(f"• {memory.description} ({memory.date})" for memory in memories[:3])
+        lines.append("")
+        lines.append("Would you like to tell me more about any of these?")
+        return "\n".join(lines)
     
-    def _format_family_response(self, family_info: List[Dict[str, Any]]) -> str:
+    def _format_family_response(self, family_info: Sequence[FamilyMember]) -> str:
         """Format family information response."""
         if not family_info:
             return "I'm here to help you remember your family. Take your time."
         
-        response = "Here's information about your family:\n\n"
-        for member in family_info:
-            response += f"• {member['name']} - your {member['relationship']} (age {member['age']})\n"
-        
-        return response
+        lines = ["Here's information about your family:", ""]
+        lines.extend(f"• {member.name} - your {member.relationship} (age {member.age})" for member in family_info)
+        lines.append("")
+        return "\n".join(lines)
     
     def _format_person_response(self, person_info: Dict[str, Any]) -> str:
         """Format person information response."""
         return f"{person_info['name']} is your {person_info['relationship']}. {person_info['important_notes']}"
     
-    def _format_place_response(self, place_info: Dict[str, Any]) -> str:
+    def _format_place_response(self, place_info: Place) -> str:
         """Format place information response."""
-        return f"{place_info['name']} is located at {place_info['address']}. {place_info['description']}"
+        return f"{place_info.name} is located at {place_info.address}. {place_info.description}"
     
-    def _format_event_response(self, event_info: Dict[str, Any]) -> str:
+    def _format_event_response(self, event_info: Event) -> str:
         """Format event information response."""
-        return f"{event_info['event']} was on {event_info['date']}, {event_info['year']}. {event_info['description']}"
+        return f"{event_info.event} was on {event_info.date}, {event_info.year}. {event_info.description}"
     
     def _format_reminiscence_response(self, prompts: List[Dict[str, Any]]) -> str:
         """Format reminiscence response."""
         if not prompts:
             return "Let's talk about your memories. What would you like to share?"
         
-        response = "Let's take a gentle walk down memory lane. Here are some things we can talk about:\n\n"
-        for prompt in prompts:
-            response += f"• {prompt['prompt']}\n"
-        
-        response += "\nTake your time, and tell me whatever comes to mind."
-        return response
+        lines = ["Let's take a gentle walk down memory lane. Here are some things we can talk about:", ""]
+        lines.extend(f"• {prompt['prompt']}" for prompt in prompts)
+        lines.append("")
+        lines.append("Take your time, and tell me whatever comes to mind.")
+        return "\n".join(lines)
     
-    def _format_exercise_response(self, exercise: Dict[str, Any]) -> str:
+    def _format_exercise_response(self, exercise: Exercise) -> str:
         """Format cognitive exercise response."""
-        response = f"Let's do a gentle {exercise['type']} exercise. {exercise['instructions']}\n\n"
-        response += f"Here's the exercise: {exercise['exercise']}\n\n"
-        response += "Ready when you are!"
-        return response
+        return (
+            f"Let's do a gentle {exercise.type} exercise. {exercise.instructions}\n\n"
+            f"Here's the exercise: {exercise.prompt}\n\n"
+            "Ready when you are!"
+        )
     
     def _provide_encouraging_memory_support(self, content: str) -> str:
         """Provide encouraging memory support."""
-        responses = [
-            "I'm here to help you remember. Take your time, there's no rush.",
-            "Memory can be tricky sometimes, but we'll work through this together.",
-            "It's okay if you don't remember right away. I'm patient and here to help.",
-            "Let's take this one step at a time. What would you like to remember?"
-        ]
-        
         # Simple response selection based on content
-        if "help" in content:
-            return responses[0]
-        elif "forgot" in content:
-            return responses[1]
-        elif "remember" in content:
-            return responses[2]
-        else:
-            return responses[3]
+        return self._ENCOURAGING_RESPONSES[_ENCOURAGEMENT_KEYWORDS.match(content)]
     
-    def _initialize_default_content(self):
-        """Initialize default memories and exercises."""
-        # Add some default reminiscence prompts
-        self.cognitive_exercises["reminiscence_prompts"] = [
-            "Tell me about your favorite childhood memory",
-            "What was your first job like?",
-            "Tell me about your wedding day",
-            "What was your favorite holiday tradition?",
-            "Tell me about your children when they were young"
-        ]
+    def add_memory(self, memory_data: Union[Memory, Mapping[str, Any]]) -> Memory:
+        """Add a new memory to the database."""
+        return self.add_memories([memory_data])[0]
+    
+    def add_memories(self, memories: Sequence[Union[Memory, Mapping[str, Any]]]) -> List[Memory]:
+        """
+        Add several memories to the database at once.
         
-        # Add some default cognitive exercises
-        self.cognitive_exercises["word_association"] = [
-            {"word": "home", "associations": ["family", "comfort", "love"]},
-            {"word": "spring", "associations": ["flowers", "renewal", "growth"]},
-            {"word": "music", "associations": ["dancing", "singing", "joy"]}
-        ]
+        The batch shares one creation timestamp, and the random ids for all
+        of its memories come from a single read.
+        
+        Args:
+            memories: Memories to add, as Memory rows or field mappings;
+                each row gets an id and created_at
+            
+        Returns:
+            The stored Memory rows, in order
+        """
+        created_at = datetime.now().isoformat()
+        ids = os.urandom(16 * len(memories)).hex()
+        rows = [_memory_from(memory) for memory in memories]
+        for i, memory in enumerate(rows):
+            memory.id = ids[32 * i:32 * (i + 1)]
+            memory.created_at = created_at
+            self._memories_by_id[memory.id] = memory
+        self.memory_database["personal_memories"].extend(rows)
+        return rows
     
-    def add_memory(self, memory_data: Dict[str, Any]):
-        """Add a new memory to the database."""
-        memory_data["id"] = str(uuid.uuid4())
-        memory_data["created_at"] = datetime.now().isoformat()
-        self.memory_database["personal_memories"].append(memory_data)
+    def get_memory(self, memory_id: str) -> Optional[Memory]:
+        """Get a memory by id, or None if there is no such memory."""
+        return self._memories_by_id.get(memory_id)
     
-    def update_family_member(self, member_data: Dict[str, Any]):
-        """Update family member information."""
-        for member in self.memory_database["family_members"]:
-            if member["name"] == member_data["name"]:
-                member.update(member_data)
-                return
+    def update_family_member(self, member_data: Union[FamilyMember, Mapping[str, Any]]) -> FamilyMember:
+        """
+        Update family member information, adding the member if not found.
+        
+        Args:
+            member_data: A FamilyMember row, or a mapping with a "name" and
+                the fields to set; fields it leaves out keep their stored
+                values, and unknown keys are kept in the row's extra dict
+            
+        Returns:
+            The stored FamilyMember row
+        """
+        if isinstance(member_data, FamilyMember):
+            name = member_data.name
+        elif "name" in member_data:
+            name = member_data["name"]
+        else:
+            raise ValueError("family member data needs a 'name'")
+        
+        member = self._family_by_name.get(name)
+        if member is not None:
+            if isinstance(member_data, FamilyMember):
+                # A full row replaces every column but the stored id
+                for column in _ROW_COLUMNS[FamilyMember] - {"id", "extra"}:
+                    setattr(member, column, getattr(member_data, column))
+                member.extra.update(member_data.extra)
+            else:
+                _apply_fields(member, member_data)
+            return member
         
         # Add new family member if not found
-        member_data["id"] = str(uuid.uuid4())
-        self.memory_database["family_members"].append(member_data)
+        member = _family_member_from(member_data)
+        member.id = uuid.uuid4().hex
+        self.memory_database["family_members"].append(member)
+        self._family_by_name[member.name] = member
+        return member
@@ -5,11 +5,177 @@ This agent specializes in helping individuals with Alzheimer's disease
 manage their daily routines, medications, appointments, and activities.
 """
 
-import json
+import time
 import uuid
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta, time
-import asyncio
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Mapping, Optional, Any, Sequence, Tuple
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+import heapq
+from operator import itemgetter
+
+from .keywords import KeywordTable
+
+# Request categories in dispatch priority order
+_REQUEST_KEYWORDS = KeywordTable((
+    ("medication", ("medicine", "medication", "pill")),
+    ("appointment", ("appointment", "doctor", "schedule")),
+    ("time", ("time", "what time", "when")),
+    ("meal", ("meal", "eat", "food")),
+    ("activity", ("activity", "exercise", "walk")),
+    ("daily_routine", ("routine", "schedule", "today")),
+), ignore_case=True)
+
+_TIME_QUESTIONS = KeywordTable((
+    ("current", ("what time",)),
+    ("next", ("next",)),
+), ignore_case=True)
+
+_GENERAL_SUPPORT_KEYWORDS = KeywordTable((
+    ("help", ("help",)),
+    ("schedule", ("schedule",)),
+    ("remember", ("remember",)),
+), ignore_case=True)
+
+
+def _minute_of_day(scheduled_time: str) -> int:
+    """Convert an "HH:MM" time to minutes after midnight."""
+    try:
+        hour, minute = map(int, scheduled_time.split(":"))
+    except (AttributeError, ValueError):
+        hour = minute = -1
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f'scheduled time must be "HH:MM", got {scheduled_time!r}')
+    return hour * 60 + minute
+
+
+# Meal for each hour of the day
+_MEAL_BY_HOUR = ("snack",) * 6 + ("breakfast",) * 5 + ("lunch",) * 4 + ("dinner",) * 4 + ("snack",) * 5
+
+_MORNING_SUGGESTIONS = (
+    MappingProxyType({"name": "Morning walk", "description": "A gentle walk around the neighborhood"}),
+    MappingProxyType({"name": "Breakfast", "description": "Enjoy a healthy breakfast"}),
+    MappingProxyType({"name": "Newspaper reading", "description": "Read the morning paper"})
+)
+
+_LATE_MORNING_SUGGESTIONS = (
+    MappingProxyType({"name": "Gardening", "description": "Tend to your garden or plants"}),
+    MappingProxyType({"name": "Crafts", "description": "Work on a craft project"}),
+    MappingProxyType({"name": "Music", "description": "Listen to your favorite music"})
+)
+
+_AFTERNOON_SUGGESTIONS = (
+    MappingProxyType({"name": "Lunch", "description": "Have a nutritious lunch"}),
+    MappingProxyType({"name": "Rest", "description": "Take a short nap or rest"}),
+    MappingProxyType({"name": "Reading", "description": "Read a book or magazine"})
+)
+
+_EVENING_SUGGESTIONS = (
+    MappingProxyType({"name": "Evening walk", "description": "A gentle evening stroll"}),
+    MappingProxyType({"name": "Dinner", "description": "Enjoy dinner"}),
+    MappingProxyType({"name": "Relaxation", "description": "Relax and unwind"})
+)
+
+# Suggested activities for each hour of the day, shared read-only
+_SUGGESTIONS_BY_HOUR = (
+    (_EVENING_SUGGESTIONS,) * 6
+    + (_MORNING_SUGGESTIONS,) * 3
+    + (_LATE_MORNING_SUGGESTIONS,) * 3
+    + (_AFTERNOON_SUGGESTIONS,) * 3
+    + (_EVENING_SUGGESTIONS,) * 9
+)
+
+# Sort key for (minute of day, item) daily schedule entries
+_schedule_key = itemgetter(0)
+
+
+def _schedule_minute(scheduled_time: str) -> int:
+    """Minute of day for an appointment time, with blank or unreadable times first."""
+    try:
+        return _minute_of_day(scheduled_time)
+    except ValueError:
+        return -1
+
+
+@lru_cache(maxsize=256)
+def _appointment_day(appointment_date: str) -> str:
+    """Format an ISO appointment date as e.g. "Monday, January 15"."""
+    return datetime.fromisoformat(appointment_date).strftime('%A, %B %d')
+
+
+# Requests in the same second read the same clock text
+@lru_cache(maxsize=32)
+def _format_clock(seconds: int, fmt: str) -> str:
+    """Format a local timestamp in whole seconds with strftime."""
+    return datetime.fromtimestamp(seconds).strftime(fmt)
+
+
+# (second, ISO timestamp) last handed out by _now_iso
+_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, refreshed at most once a second."""
+    global _iso_cache
+    second = int(time.time())
+    if _iso_cache[0] != second:
+        _iso_cache = (second, datetime.now().isoformat())
+    return _iso_cache[1]
+
+
+class _TimeIndex:
+    """
+    Routine entries ordered by scheduled time of day.
+    
+    Entries are parsed once when added, so lookups bisect a sorted column of
+    minutes instead of scanning and re-parsing every entry. Entries with the
+    same time keep the order they were added in. Entries without a time are
+    kept apart; they are listed in the daily schedule but never due.
+    """
+    
+    __slots__ = ("minutes", "entries", "untimed")
+    
+    def __init__(self):
+        # Unsigned 16-bit minutes, parallel to entries
+        self.minutes = array("H")
+        self.entries: List[Dict[str, Any]] = []
+        self.untimed: List[Dict[str, Any]] = []
+    
+    def add(self, entry: Dict[str, Any]):
+        """
+        Index an entry by its scheduled_time.
+        
+        Raises:
+            ValueError: If scheduled_time is set but not a valid "HH:MM" time
+        """
+        scheduled_time = entry.get("scheduled_time")
+        if not scheduled_time:
+            self.untimed.append(entry)
+            return
+        minute = _minute_of_day(scheduled_time)
+        position = bisect_right(self.minutes, minute)
+        self.minutes.insert(position, minute)
+        self.entries.insert(position, entry)
+    
+    def between(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """Entries scheduled from start to end minutes, inclusive."""
+        return self.entries[bisect_left(self.minutes, start):bisect_right(self.minutes, end)]
+    
+    def by_minute(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """(minute of day, entry) pairs in time order, untimed entries first as -1."""
+        return chain(((-1, entry) for entry in self.untimed), zip(self.minutes, self.entries))
+    
+    def after(self, minute: int) -> Iterator[Dict[str, Any]]:
+        """Entries scheduled later than minute, earliest first."""
+        # Walk from the bisect point rather than slicing, so taking the
+        # first match does not copy the rest of the day
+        entries = self.entries
+        for position in range(bisect_right(self.minutes, minute), len(entries)):
+            yield entries[position]
+
 
 class RoutineManagementAgent:
     """
@@ -17,6 +183,14 @@ class RoutineManagementAgent:
     Provides medication reminders, appointment scheduling, and activity guidance.
     """
     
+    # General support replies by matched keyword
+    _GENERAL_RESPONSES = MappingProxyType({
+        "help": "I'm here to help you with your daily routine. What would you like to know?",
+        "schedule": "Let me help you stay on track with your schedule. What do you need?",
+        "remember": "I can help you remember your medications, appointments, and activities. What would you like to check?",
+        None: "Your routine is important for your wellbeing. How can I help you today?"
+    })
+    
     def __init__(self, user_id: str):
         """
         Initialize the routine management agent.
@@ -37,6 +211,14 @@ class RoutineManagementAgent:
             "bedtime_routine": []
         }
         
+        # Medications and activities indexed by time of day
+        self._medication_index = _TimeIndex()
+        self._activity_index = _TimeIndex()
+        
+        # Dated appointments ordered by day, with the parsed days alongside
+        self._appointment_days: List[date] = []
+        self._appointments_by_day: List[Dict[str, Any]] = []
+        
         # Reminder system
         self.active_reminders = []
         self.reminder_templates = {
@@ -48,6 +230,17 @@ class RoutineManagementAgent:
         
         # Initialize with default routines
         self._initialize_default_routines()
+        
+        # Request handlers by keyword category, None when nothing matched
+        self._request_handlers = {
+            "medication": self._handle_medication_request,
+            "appointment": self._handle_appointment_request,
+            "time": self._handle_time_request,
+            "meal": self._handle_meal_request,
+            "activity": self._handle_activity_request,
+            "daily_routine": self._handle_daily_routine_request,
+            None: self._handle_general_routine_support,
+        }
     
     async def process_request(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -60,35 +253,27 @@ class RoutineManagementAgent:
         Returns:
             Response from the routine management agent
         """
+        # One timestamp for the response
+        timestamp = _now_iso()
+        
         try:
-            content = input_data.get("content", "").lower()
+            # Keyword tables ignore case, so content is not lowercased
+            content = input_data.get("content", "")
             input_type = input_data.get("type", "text")
             
             # Determine the type of routine assistance needed
-            if "medicine" in content or "medication" in content or "pill" in content:
-                return await self._handle_medication_request(content, context)
-            elif "appointment" in content or "doctor" in content or "schedule" in content:
-                return await self._handle_appointment_request(content, context)
-            elif "time" in content or "what time" in content or "when" in content:
-                return await self._handle_time_request(content, context)
-            elif "meal" in content or "eat" in content or "food" in content:
-                return await self._handle_meal_request(content, context)
-            elif "activity" in content or "exercise" in content or "walk" in content:
-                return await self._handle_activity_request(content, context)
-            elif "routine" in content or "schedule" in content or "today" in content:
-                return await self._handle_daily_routine_request(content, context)
-            else:
-                return await self._handle_general_routine_support(content, context)
+            category = _REQUEST_KEYWORDS.match(content)
+            return self._request_handlers[category](content, context, timestamp)
                 
         except Exception as e:
             return {
                 "agent": self.agent_id,
                 "error": True,
                 "message": f"Error in routine management: {str(e)}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
-    async def _handle_medication_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_medication_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle medication-related requests."""
         current_time = datetime.now()
         
@@ -109,10 +294,10 @@ class RoutineManagementAgent:
             "content": response_text,
             "reminder_type": reminder_type,
             "medications_due": len(due_medications),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_appointment_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_appointment_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle appointment-related requests."""
         current_time = datetime.now()
         
@@ -130,17 +315,18 @@ class RoutineManagementAgent:
             "type": "appointment",
             "content": response_text,
             "appointments_today": len(today_appointments),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_time_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_time_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle time-related requests."""
         current_time = datetime.now()
         
         # Determine what time information is needed
-        if "what time" in content:
-            response_text = f"It's currently {current_time.strftime('%I:%M %p')} on {current_time.strftime('%A, %B %d')}"
-        elif "next" in content:
+        question = _TIME_QUESTIONS.match(content)
+        if question == "current":
+            response_text = _format_clock(int(current_time.timestamp()), "It's currently %I:%M %p on %A, %B %d")
+        elif question == "next":
             next_activity = self._get_next_scheduled_activity(current_time)
             response_text = self._format_next_activity_info(next_activity)
         else:
@@ -150,10 +336,10 @@ class RoutineManagementAgent:
             "agent": self.agent_id,
             "type": "time_info",
             "content": response_text,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_meal_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_meal_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle meal-related requests."""
         current_time = datetime.now()
         
@@ -169,10 +355,10 @@ class RoutineManagementAgent:
             "content": response_text,
             "meal_type": meal_type,
             "next_meal": next_meal,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_activity_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_activity_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle activity-related requests."""
         current_time = datetime.now()
         
@@ -190,10 +376,10 @@ class RoutineManagementAgent:
             "type": "activity",
             "content": response_text,
             "activities_scheduled": len(scheduled_activities),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_daily_routine_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_daily_routine_request(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle daily routine requests."""
         current_time = datetime.now()
         
@@ -207,10 +393,10 @@ class RoutineManagementAgent:
             "type": "daily_routine",
             "content": response_text,
             "schedule_items": len(daily_schedule),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
-    async def _handle_general_routine_support(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_general_routine_support(self, content: str, context: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """Handle general routine support requests."""
         response_text = self._provide_general_routine_support(content)
         
@@ -218,111 +404,51 @@ class RoutineManagementAgent:
             "agent": self.agent_id,
             "type": "general_support",
             "content": response_text,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
     def _get_due_medications(self, current_time: datetime) -> List[Dict[str, Any]]:
         """Get medications that are due now."""
-        due_medications = []
-        current_hour = current_time.hour
-        current_minute = current_time.minute
-        
-        for medication in self.routine_database["medications"]:
-            if medication.get("active", True):
-                scheduled_time = medication.get("scheduled_time")
-                if scheduled_time:
-                    med_hour, med_minute = map(int, scheduled_time.split(":"))
-                    # Check if it's within 30 minutes of scheduled time
-                    if (current_hour == med_hour and abs(current_minute - med_minute) <= 30):
-                        due_medications.append(medication)
-        
-        return due_medications
+        # Due within 30 minutes of the scheduled time, in the current hour
+        return [
+            medication
+            for medication in self._medication_index.between(*self._current_window(current_time))
+            if medication.get("active", True)
+        ]
     
     def _get_next_medication(self, current_time: datetime) -> Optional[Dict[str, Any]]:
         """Get the next scheduled medication."""
-        current_hour = current_time.hour
-        current_minute = current_time.minute
-        
-        next_medication = None
-        next_time = None
-        
-        for medication in self.routine_database["medications"]:
-            if medication.get("active", True):
-                scheduled_time = medication.get("scheduled_time")
-                if scheduled_time:
-                    med_hour, med_minute = map(int, scheduled_time.split(":"))
-                    med_time = med_hour * 60 + med_minute
-                    current_time_minutes = current_hour * 60 + current_minute
-                    
-                    if med_time > current_time_minutes:
-                        if next_time is None or med_time < next_time:
-                            next_medication = medication
-                            next_time = med_time
-        
-        return next_medication
+        current_minutes = current_time.hour * 60 + current_time.minute
+        return next(
+            (
+                medication
+                for medication in self._medication_index.after(current_minutes)
+                if medication.get("active", True)
+            ),
+            None
+        )
     
     def _get_today_appointments(self, current_time: datetime) -> List[Dict[str, Any]]:
         """Get today's appointments."""
-        today_appointments = []
         today_date = current_time.date()
-        
-        for appointment in self.routine_database["appointments"]:
-            appointment_date = appointment.get("date")
-            if appointment_date and appointment_date == today_date.isoformat():
-                today_appointments.append(appointment)
-        
-        return today_appointments
+        return self._appointments_by_day[
+            bisect_left(self._appointment_days, today_date):bisect_right(self._appointment_days, today_date)
+        ]
     
     def _get_upcoming_appointments(self, current_time: datetime) -> List[Dict[str, Any]]:
         """Get upcoming appointments."""
-        upcoming_appointments = []
-        current_date = current_time.date()
-        
-        for appointment in self.routine_database["appointments"]:
-            appointment_date = appointment.get("date")
-            if appointment_date:
-                appt_date = datetime.fromisoformat(appointment_date).date()
-                if appt_date >= current_date:
-                    upcoming_appointments.append(appointment)
-        
-        # Sort by date
-        upcoming_appointments.sort(key=lambda x: x.get("date", ""))
-        return upcoming_appointments[:3]  # Return next 3 appointments
+        # Appointments are kept sorted by date
+        start = bisect_left(self._appointment_days, current_time.date())
+        return self._appointments_by_day[start:start + 3]  # Return next 3 appointments
     
     def _get_next_scheduled_activity(self, current_time: datetime) -> Optional[Dict[str, Any]]:
         """Get the next scheduled activity."""
-        current_hour = current_time.hour
-        current_minute = current_time.minute
-        
-        next_activity = None
-        next_time = None
-        
-        for activity in self.routine_database["activities"]:
-            scheduled_time = activity.get("scheduled_time")
-            if scheduled_time:
-                act_hour, act_minute = map(int, scheduled_time.split(":"))
-                act_time = act_hour * 60 + act_minute
-                current_time_minutes = current_hour * 60 + current_minute
-                
-                if act_time > current_time_minutes:
-                    if next_time is None or act_time < next_time:
-                        next_activity = activity
-                        next_time = act_time
-        
-        return next_activity
+        current_minutes = current_time.hour * 60 + current_time.minute
+        return next(self._activity_index.after(current_minutes), None)
     
     def _determine_meal_type(self, current_time: datetime) -> str:
         """Determine what meal it should be based on time."""
-        current_hour = current_time.hour
-        
-        if 6 <= current_hour < 11:
-            return "breakfast"
-        elif 11 <= current_hour < 15:
-            return "lunch"
-        elif 15 <= current_hour < 19:
-            return "dinner"
-        else:
-            return "snack"
+        return _MEAL_BY_HOUR[current_time.hour]
     
     def _get_next_meal_time(self, current_time: datetime) -> Optional[str]:
         """Get the next meal time."""
@@ -339,98 +465,75 @@ class RoutineManagementAgent:
     
     def _get_scheduled_activities(self, current_time: datetime) -> List[Dict[str, Any]]:
         """Get activities scheduled for now."""
-        current_hour = current_time.hour
-        current_minute = current_time.minute
-        
-        scheduled_activities = []
-        
-        for activity in self.routine_database["activities"]:
-            scheduled_time = activity.get("scheduled_time")
-            if scheduled_time:
-                act_hour, act_minute = map(int, scheduled_time.split(":"))
-                if (act_hour == current_hour and abs(act_minute - current_minute) <= 30):
-                    scheduled_activities.append(activity)
+        return self._activity_index.between(*self._current_window(current_time))
+    
+    @staticmethod
+    def _current_window(current_time: datetime) -> Tuple[int, int]:
+        """
+        Minutes of the day counted as "now" for reminders.
         
-        return scheduled_activities
+        Covers 30 minutes either side of current_time, clipped to the
+        current hour.
+        """
+        hour_start = current_time.hour * 60
+        current_minutes = hour_start + current_time.minute
+        return max(hour_start, current_minutes - 30), min(hour_start + 59, current_minutes + 30)
     
-    def _get_suggested_activities(self) -> List[Dict[str, Any]]:
+    def _get_suggested_activities(self) -> Sequence[Mapping[str, Any]]:
         """Get suggested activities for the current time."""
-        current_time = datetime.now()
-        current_hour = current_time.hour
-        
-        if 6 <= current_hour < 9:
-            return [
-                {"name": "Morning walk", "description": "A gentle walk around the neighborhood"},
-                {"name": "Breakfast", "description": "Enjoy a healthy breakfast"},
-                {"name": "Newspaper reading", "description": "Read the morning paper"}
-            ]
-        elif 9 <= current_hour < 12:
-            return [
-                {"name": "Gardening", "description": "Tend to your garden or plants"},
-                {"name": "Crafts", "description": "Work on a craft project"},
-                {"name": "Music", "description": "Listen to your favorite music"}
-            ]
-        elif 12 <= current_hour < 15:
-            return [
-                {"name": "Lunch", "description": "Have a nutritious lunch"},
-                {"name": "Rest", "description": "Take a short nap or rest"},
-                {"name": "Reading", "description": "Read a book or magazine"}
-            ]
-        else:
-            return [
-                {"name": "Evening walk", "description": "A gentle evening stroll"},
-                {"name": "Dinner", "description": "Enjoy dinner"},
-                {"name": "Relaxation", "description": "Relax and unwind"}
-            ]
+        return _SUGGESTIONS_BY_HOUR[datetime.now().hour]
     
     def _get_daily_schedule(self, current_time: datetime) -> List[Dict[str, Any]]:
         """Get today's complete schedule."""
-        daily_schedule = []
-        
-        # Add medications
-        for medication in self.routine_database["medications"]:
-            if medication.get("active", True):
-                daily_schedule.append({
-                    "time": medication.get("scheduled_time", ""),
-                    "activity": f"Take {medication.get('name', 'medication')}",
-                    "type": "medication"
-                })
-        
-        # Add appointments
-        today_appointments = self._get_today_appointments(current_time)
-        for appointment in today_appointments:
-            daily_schedule.append({
-                "time": appointment.get("time", ""),
-                "activity": f"Appointment with {appointment.get('doctor_name', 'doctor')}",
-                "type": "appointment"
+        # Medications and activities come from the time indexes already in
+        # minute order, so only today's few appointments need sorting. Each
+        # stream yields (minute of day, item) so all three share one key.
+        medications = (
+            (minute, {
+                "time": medication.get("scheduled_time", ""),
+                "activity": f"Take {medication.get('name', 'medication')}",
+                "type": "medication"
             })
-        
-        # Add activities
-        for activity in self.routine_database["activities"]:
-            if activity.get("active", True):
-                daily_schedule.append({
-                    "time": activity.get("scheduled_time", ""),
-                    "activity": activity.get("name", "Activity"),
-                    "type": "activity"
+            for minute, medication in self._medication_index.by_minute()
+            if medication.get("active", True)
+        )
+        appointments = sorted(
+            (
+                (_schedule_minute(appointment.get("time", "")), {
+                    "time": appointment.get("time", ""),
+                    "activity": f"Appointment with {appointment.get('doctor_name', 'doctor')}",
+                    "type": "appointment"
                 })
+                for appointment in self._get_today_appointments(current_time)
+            ),
+            key=_schedule_key
+        )
+        activities = (
+            (minute, {
+                "time": activity.get("scheduled_time", ""),
+                "activity": activity.get("name", "Activity"),
+                "type": "activity"
+            })
+            for minute, activity in self._activity_index.by_minute()
+            if activity.get("active", True)
+        )
         
-        # Sort by time
-        daily_schedule.sort(key=lambda x: x.get("time", ""))
-        return daily_schedule
+        # Ties keep medications, then appointments, then activities
+        return [item for _, item in heapq.merge(medications, appointments, activities, key=_schedule_key)]
     
     def _format_medication_reminder(self, medications: List[Dict[str, Any]]) -> str:
         """Format medication reminder message."""
         if not medications:
             return "No medications are due right now."
         
-        response = "It's time for your medication:\n\n"
+        lines = ["It's time for your medication:", ""]
         for med in medications:
-            response += f"• {med.get('name', 'Medication')} - {med.get('dosage', '1 pill')}\n"
+            lines.append(f"• {med.get('name', 'Medication')} - {med.get('dosage', '1 pill')}")
             if med.get('instructions'):
-                response += f"  Instructions: {med['instructions']}\n"
-        
-        response += "\nPlease take your medication as directed."
-        return response
+                lines.append(f"  Instructions: {med['instructions']}")
+        lines.append("")
+        lines.append("Please take your medication as directed.")
+        return "\n".join(lines)
     
     def _format_next_medication_info(self, medication: Optional[Dict[str, Any]]) -> str:
         """Format next medication information."""
@@ -444,27 +547,28 @@ class RoutineManagementAgent:
         if not appointments:
             return "No appointments scheduled for today."
         
-        response = "You have appointments today:\n\n"
+        lines = ["You have appointments today:", ""]
         for appointment in appointments:
-            response += f"• {appointment.get('time', 'Unknown time')} - {appointment.get('doctor_name', 'Doctor')}\n"
+            lines.append(f"• {appointment.get('time', 'Unknown time')} - {appointment.get('doctor_name', 'Doctor')}")
             if appointment.get('location'):
-                response += f"  Location: {appointment['location']}\n"
+                lines.append(f"  Location: {appointment['location']}")
             if appointment.get('notes'):
-                response += f"  Notes: {appointment['notes']}\n"
-        
-        return response
+                lines.append(f"  Notes: {appointment['notes']}")
+        lines.append("")
+        return "\n".join(lines)
     
     def _format_upcoming_appointments(self, appointments: List[Dict[str, Any]]) -> str:
         """Format upcoming appointments message."""
         if not appointments:
             return "No upcoming appointments scheduled."
         
-        response = "Your upcoming appointments:\n\n"
-        for appointment in appointments:
-            appt_date = datetime.fromisoformat(appointment.get('date', '')).strftime('%A, %B %d')
-            response += f"• {appt_date} at {appointment.get('time', 'Unknown time')} - {appointment.get('doctor_name', 'Doctor')}\n"
-        
-        return response
+        lines = ["Your upcoming appointments:", ""]
+        lines.extend(
+            f"• {_appointment_day(appointment['date'])} at {appointment.get('time', 'Unknown time')} - {appointment.get('doctor_name', 'Doctor')}"
+            for appointment in appointments
+        )
+        lines.append("")
+        return "\n".join(lines)
     
     def _format_next_activity_info(self, activity: Optional[Dict[str, Any]]) -> str:
         """Format next activity information."""
@@ -475,7 +579,7 @@ class RoutineManagementAgent:
     
     def _format_current_time_info(self, current_time: datetime) -> str:
         """Format current time information."""
-        return f"It's {current_time.strftime('%I:%M %p')} on {current_time.strftime('%A, %B %d, %Y')}."
+        return _format_clock(int(current_time.timestamp()), "It's %I:%M %p on %A, %B %d, %Y.")
     
     def _format_meal_reminder(self, meal_type: str, next_meal: Optional[str]) -> str:
         """Format meal reminder message."""
@@ -489,54 +593,38 @@ class RoutineManagementAgent:
         if not activities:
             return "No activities scheduled right now."
         
-        response = "It's time for your activities:\n\n"
+        lines = ["It's time for your activities:", ""]
         for activity in activities:
-            response += f"• {activity.get('name', 'Activity')}\n"
+            lines.append(f"• {activity.get('name', 'Activity')}")
             if activity.get('description'):
-                response += f"  {activity['description']}\n"
-        
-        return response
+                lines.append(f"  {activity['description']}")
+        lines.append("")
+        return "\n".join(lines)
     
     def _format_activity_suggestions(self, activities: List[Dict[str, Any]]) -> str:
         """Format activity suggestions message."""
         if not activities:
             return "No activities suggested at this time."
         
-        response = "Here are some activities you might enjoy:\n\n"
-        for activity in activities:
-            response += f"• {activity.get('name', 'Activity')} - {activity.get('description', '')}\n"
-        
-        return response
+        lines = ["Here are some activities you might enjoy:", ""]
+        lines.extend(f"• {activity.get('name', 'Activity')} - {activity.get('description', '')}" for activity in activities)
+        lines.append("")
+        return "\n".join(lines)
     
     def _format_daily_schedule(self, schedule: List[Dict[str, Any]]) -> str:
         """Format daily schedule message."""
         if not schedule:
             return "No schedule items for today."
         
-        response = "Here's your schedule for today:\n\n"
-        for item in schedule:
-            response += f"• {item.get('time', 'Unknown time')} - {item.get('activity', 'Activity')}\n"
-        
-        return response
+        lines = ["Here's your schedule for today:", ""]
+        lines.extend(f"• {item['time']} - {item['activity']}" for item in schedule)
+        lines.append("")
+        return "\n".join(lines)
     
     def _provide_general_routine_support(self, content: str) -> str:
         """Provide general routine support."""
-        responses = [
-            "I'm here to help you with your daily routine. What would you like to know?",
-            "Let me help you stay on track with your schedule. What do you need?",
-            "I can help you remember your medications, appointments, and activities. What would you like to check?",
-            "Your routine is important for your wellbeing. How can I help you today?"
-        ]
-        
         # Simple response selection based on content
-        if "help" in content:
-            return responses[0]
-        elif "schedule" in content:
-            return responses[1]
-        elif "remember" in content:
-            return responses[2]
-        else:
-            return responses[3]
+        return self._GENERAL_RESPONSES[_GENERAL_SUPPORT_KEYWORDS.match(content)]
     
     def _initialize_default_routines(self):
         """Initialize default routines and schedules."""
@@ -559,6 +647,8 @@ class RoutineManagementAgent:
                 "active": True
             }
         ]
+        for medication in self.routine_database["medications"]:
+            self._medication_index.add(medication)
         
         # Add some default activities
         self.routine_database["activities"] = [
@@ -577,20 +667,48 @@ class RoutineManagementAgent:
                 "active": True
             }
         ]
+        for activity in self.routine_database["activities"]:
+            self._activity_index.add(activity)
     
     def add_medication(self, medication_data: Dict[str, Any]):
-        """Add a new medication to the routine."""
+        """
+        Add a new medication to the routine.
+        
+        Raises:
+            ValueError: If scheduled_time is set but not a valid "HH:MM" time
+        """
         medication_data["id"] = str(uuid.uuid4())
         medication_data["active"] = True
+        self._medication_index.add(medication_data)
         self.routine_database["medications"].append(medication_data)
     
     def add_appointment(self, appointment_data: Dict[str, Any]):
-        """Add a new appointment."""
+        """
+        Add a new appointment.
+        
+        Raises:
+            ValueError: If date is set but not an ISO date
+        """
         appointment_data["id"] = str(uuid.uuid4())
+        
+        # Parse the date once and keep the appointment in date order
+        appointment_date = appointment_data.get("date")
+        if appointment_date:
+            day = datetime.fromisoformat(appointment_date).date()
+            position = bisect_right(self._appointment_days, day)
+            self._appointment_days.insert(position, day)
+            self._appointments_by_day.insert(position, appointment_data)
+        
         self.routine_database["appointments"].append(appointment_data)
     
     def add_activity(self, activity_data: Dict[str, Any]):
-        """Add a new activity to the routine."""
+        """
+        Add a new activity to the routine.
+        
+        Raises:
+            ValueError: If scheduled_time is set but not a valid "HH:MM" time
+        """
         activity_data["id"] = str(uuid.uuid4())
         activity_data["active"] = True
+        self._activity_index.add(activity_data)
         self.routine_database["activities"].append(activity_data)
@@ -10,6 +10,8 @@ import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import uuid
+from collections import deque
+from functools import cached_property
 
 class CognitiveAssistant:
     """
@@ -28,12 +30,6 @@ class CognitiveAssistant:
         self.session_id = str(uuid.uuid4())
         self.created_at = datetime.now()
         
-        # Initialize specialized agents
-        self.memory_agent = None
-        self.routine_agent = None
-        self.safety_agent = None
-        self.communication_agent = None
-        
         # User profile and preferences
         self.user_profile = {
             "name": "",
@@ -55,24 +51,36 @@ class CognitiveAssistant:
             "time_of_day": None,
             "location": None,
             "mood": None,
-            "recent_interactions": [],
+            "recent_interactions": deque(maxlen=10),  # Last 10 interactions
             "active_reminders": []
         }
-        
-        # Initialize agents
-        self._initialize_agents()
     
-    def _initialize_agents(self):
-        """Initialize all specialized agents."""
+    # Specialized agents are imported and built on first use, so a session
+    # only pays for the agents its requests actually reach
+    
+    @cached_property
+    def memory_agent(self):
+        """Memory assistance agent."""
         from .agents.memory_agent import MemoryAssistanceAgent
+        return MemoryAssistanceAgent(self.user_id)
+    
+    @cached_property
+    def routine_agent(self):
+        """Routine management agent."""
         from .agents.routine_agent import RoutineManagementAgent
+        return RoutineManagementAgent(self.user_id)
+    
+    @cached_property
+    def safety_agent(self):
+        """Safety monitoring agent."""
         from .agents.safety_agent import SafetyMonitoringAgent
+        return SafetyMonitoringAgent(self.user_id)
+    
+    @cached_property
+    def communication_agent(self):
+        """Family communication agent."""
         from .agents.communication_agent import FamilyCommunicationAgent
-        
-        self.memory_agent = MemoryAssistanceAgent(self.user_id)
-        self.routine_agent = RoutineManagementAgent(self.user_id)
-        self.safety_agent = SafetyMonitoringAgent(self.user_id)
-        self.communication_agent = FamilyCommunicationAgent(self.user_id)
+        return FamilyCommunicationAgent(self.user_id)
     
     async def process_user_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -112,6 +120,16 @@ class CognitiveAssistant:
                 "session_id": self.session_id
             }
     
+    def record_interaction(self, input_data: Dict[str, Any], response: Dict[str, Any]):
+        """
+        Record an input answered without running the agents.
+        
+        Keeps the context and interaction history the same as if the
+        input had gone through process_user_input.
+        """
+        self._update_context(input_data)
+        self._update_interaction_history(input_data, response)
+    
     def _update_context(self, input_data: Dict[str, Any]):
         """Update the current context with new information."""
         current_time = datetime.now()
@@ -123,10 +141,6 @@ class CognitiveAssistant:
             "type": input_data.get("type", "unknown"),
             "content": input_data.get("content", "")
         })
-        
-        # Keep only last 10 interactions
-        if len(self.current_context["recent_interactions"]) > 10:
-            self.current_context["recent_interactions"] = self.current_context["recent_interactions"][-10:]
     
     def _determine_primary_agent(self, input_data: Dict[str, Any]) -> Any:
         """
@@ -76,13 +76,12 @@ export class AudioManager {
           const timeSinceLastInterrupt = currentTimestamp - this.lastInterruptTime;
           const canInterrupt = timeSinceLastInterrupt > 0.5; // 500ms debounce
           
-          // Convert to PCM 16-bit and send base64 encoded data
+          // Convert to PCM 16-bit and send the raw samples
           const pcm16 = this.float32ToPcm16(floatSamples);
-          const base64Audio = this.pcm16ToBase64(pcm16);
           
           // Send data through callback with enhanced speech detection info
           if (this.onAudioData) {
-            this.onAudioData(base64Audio, { 
+            this.onAudioData(pcm16, { 
               audioLevel: audioLevel, 
               isSpeaking: isActivelySpeaking,
               canInterrupt: canInterrupt,
@@ -227,23 +226,6 @@ export class AudioManager {
       return Math.sqrt(sum / samples.length);
     }
 
-    /**
-     * Convert PCM 16-bit data to base64 string
-     * @param {Int16Array} pcm16 - 16-bit PCM data
-     * @returns {string} - Base64 encoded data
-     * @private
-     */
-    pcm16ToBase64(pcm16) {
-      const bytes = new Uint8Array(pcm16.buffer);
-      let binary = "";
-      
-      for (let i = 0; i < bytes.length; i++) {
-        binary += String.fromCharCode(bytes[i]);
-      }
-      
-      return btoa(binary);
-    }
-    
     /**
      * Convert base64 string to Float32Array (assumes 16-bit PCM input)
      * Enhanced to properly handle little-endian PCM data
@@ -121,11 +121,12 @@ export class VideoManager {
       // Draw video frame to canvas
       ctx.drawImage(this.videoElement, 0, 0, this.videoElement.videoWidth, this.videoElement.videoHeight);
       
-      // Get JPEG image as base64
-      const base64Image = this.canvasElement.toDataURL('image/jpeg').split(',')[1];
-      
-      // Send through callback
-      this.onImageData(base64Image);
+      // Encode the frame as JPEG and send the raw bytes through callback
+      this.canvasElement.toBlob(async (blob) => {
+        if (blob && this.onImageData) {
+          this.onImageData(await blob.arrayBuffer());
+        }
+      }, 'image/jpeg');
     }
     
     /**
@@ -148,13 +149,12 @@ export class VideoManager {
           // Get audio samples as Float32Array (-1.0 to 1.0)
           const floatSamples = event.inputBuffer.getChannelData(0);
           
-          // Convert to PCM 16-bit and send base64 encoded data
+          // Convert to PCM 16-bit and send the raw samples
           const pcm16 = this.float32ToPcm16(floatSamples);
-          const base64Audio = this.pcm16ToBase64(pcm16);
           
           // Send data through callback
           if (this.onAudioData) {
-            this.onAudioData(base64Audio);
+            this.onAudioData(pcm16);
           }
         };
         
@@ -186,21 +186,4 @@ export class VideoManager {
       
       return pcm16;
     }
-    
-    /**
-     * Convert PCM 16-bit data to base64 string
-     * @param {Int16Array} pcm16 - 16-bit PCM data
-     * @returns {string} - Base64 encoded data
-     * @private
-     */
-    pcm16ToBase64(pcm16) {
-      const bytes = new Uint8Array(pcm16.buffer);
-      let binary = "";
-      
-      for (let i = 0; i < bytes.length; i++) {
-        binary += String.fromCharCode(bytes[i]);
-      }
-      
-      return btoa(binary);
-    }
   }
@@ -2,10 +2,21 @@
  * WebSocket client for communicating with the Google A2A ADK backend
  * Handles connection setup, data transmission, and event handling
  */
+
+// First byte of each binary frame sent to the server
+const OPCODES = {
+  audio: 0,
+  image: 1,
+  text: 2,
+  interrupt: 3
+};
+
 export class WebSocketClient {
     constructor() {
       this.websocket = null;
       this.clientId = null;
+      this.encoder = new TextEncoder();
+      this.decoder = new TextDecoder();
       this.callbacks = {
         onMessage: null,
         onClose: null,
@@ -29,6 +40,8 @@ export class WebSocketClient {
         
         // Create WebSocket connection
         this.websocket = new WebSocket(`ws://localhost:8000/ws/${this.clientId}`);
+        // Server sends orjson-encoded JSON as binary frames
+        this.websocket.binaryType = 'arraybuffer';
         
         this.websocket.onopen = () => {
           console.log("WebSocket connection established");
@@ -43,9 +56,12 @@ export class WebSocketClient {
         };
         
         this.websocket.onmessage = (event) => {
-          const response = JSON.parse(event.data);
+          const data = typeof event.data === 'string' ? event.data : this.decoder.decode(event.data);
+          const response = JSON.parse(data);
           if (this.callbacks.onMessage) {
-            this.callbacks.onMessage(response);
+            // Several messages from one model response arrive as an array
+            const messages = Array.isArray(response) ? response : [response];
+            messages.forEach((message) => this.callbacks.onMessage(message));
           }
         };
         
@@ -76,28 +92,18 @@ export class WebSocketClient {
     
     /**
      * Send audio data to the server
-     * @param {string} base64Audio - Base64 encoded audio data
+     * @param {Int16Array} pcm16 - 16-bit PCM audio data
      */
-    sendAudio(base64Audio) {
-      if (!this.isConnected()) return;
-      
-      this.websocket.send(JSON.stringify({
-        type: 'audio',
-        data: base64Audio
-      }));
+    sendAudio(pcm16) {
+      this.sendBinary(OPCODES.audio, pcm16);
     }
     
     /**
      * Send image data to the server
-     * @param {string} base64Image - Base64 encoded image data
+     * @param {ArrayBuffer} jpeg - JPEG image data
      */
-    sendImage(base64Image) {
-      if (!this.isConnected()) return;
-      
-      this.websocket.send(JSON.stringify({
-        type: 'image',
-        data: base64Image
-      }));
+    sendImage(jpeg) {
+      this.sendBinary(OPCODES.image, jpeg);
     }
     
     /**
@@ -105,23 +111,32 @@ export class WebSocketClient {
      * @param {string} text - Text to send
      */
     sendText(text) {
-      if (!this.isConnected()) return;
-      
-      this.websocket.send(JSON.stringify({
-        type: 'text',
-        data: text
-      }));
+      this.sendBinary(OPCODES.text, this.encoder.encode(text));
     }
     
     /**
      * Send interrupt signal to the server
      */
     sendInterrupt() {
+      this.sendBinary(OPCODES.interrupt, new Uint8Array(0));
+    }
+    
+    /**
+     * Send a binary frame: one opcode byte followed by the raw payload
+     * @param {number} opcode - Message type opcode
+     * @param {ArrayBuffer|ArrayBufferView} payload - Raw payload bytes
+     * @private
+     */
+    sendBinary(opcode, payload) {
       if (!this.isConnected()) return;
       
-      this.websocket.send(JSON.stringify({
-        type: 'interrupt'
-      }));
+      const bytes = ArrayBuffer.isView(payload)
+        ? new Uint8Array(payload.buffer, payload.byteOffset, payload.byteLength)
+        : new Uint8Array(payload);
+      const frame = new Uint8Array(bytes.length + 1);
+      frame[0] = opcode;
+      frame.set(bytes, 1);
+      this.websocket.send(frame);
     }
     
     /**
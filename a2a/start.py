@@ -70,7 +70,9 @@ def start_server():
         # Start the server
         subprocess.run([
             sys.executable, "-m", "uvicorn", "app:app", 
-            "--host", "127.0.0.1", "--port", "8000", "--reload"
+            "--host", "127.0.0.1", "--port", "8000", "--reload",
+            "--loop", "asyncio" if sys.platform == "win32" else "uvloop",
+            "--http", "httptools", "--ws", "websockets"
         ])
         
     except KeyboardInterrupt:
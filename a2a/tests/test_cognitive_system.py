@@ -5,7 +5,10 @@ Test suite for the Cognitive Assistance System
 
 import unittest
 import asyncio
+import functools
+import json
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add the backend directory to the path
@@ -110,6 +113,44 @@ class TestMemoryAgent(unittest.TestCase):
             "age": "45"
         }
         self.agent.update_family_member(family_data)
+    
+    def test_add_memories_batch(self):
+        """Test adding several memories at once"""
+        memories = [
+            {"type": "work", "description": "First job at the bakery", "date": "1960"},
+            {"type": "marriage", "description": "Wedding day", "date": "1965"}
+        ]
+        rows = self.agent.add_memories(memories)
+        
+        ids = {memory.id for memory in rows}
+        self.assertEqual(len(ids), 2)
+        self.assertEqual(rows[0].created_at, rows[1].created_at)
+        for memory in rows:
+            self.assertIs(self.agent.get_memory(memory.id), memory)
+
+    def test_update_family_member_partial(self):
+        """Test updates only change the fields they set"""
+        self.agent.update_family_member({
+            "name": "Sarah",
+            "relationship": "daughter",
+            "location": "New York",
+            "phone": "555-0100"
+        })
+        member = self.agent.update_family_member({"name": "Sarah", "age": "46", "location": ""})
+        
+        self.assertEqual(member.relationship, "daughter")
+        self.assertEqual(member.age, "46")
+        self.assertEqual(member.location, "")
+        self.assertEqual(member.extra, {"phone": "555-0100"})
+        self.assertEqual(len(self.agent.memory_database["family_members"]), 1)
+    
+    def test_add_memory_unknown_keys(self):
+        """Test memories keep unknown keys and may omit fields"""
+        memory = self.agent.add_memory({"description": "Trip to the lake", "tags": ["summer"]})
+        
+        self.assertEqual(memory.description, "Trip to the lake")
+        self.assertEqual(memory.date, "")
+        self.assertEqual(memory.extra, {"tags": ["summer"]})
 
 class TestRoutineAgent(unittest.TestCase):
     """Test the routine management agent"""
@@ -149,6 +190,39 @@ class TestRoutineAgent(unittest.TestCase):
             "location": "Medical Center"
         }
         self.agent.add_appointment(appointment_data)
+    
+    def test_daily_schedule_order(self):
+        """Test the daily schedule is in time order for unpadded times"""
+        self.agent.add_medication({"name": "Morning Pill", "scheduled_time": "9:00"})
+        self.agent.add_activity({"name": "Gardening", "scheduled_time": "10:30"})
+        
+        schedule = self.agent._get_daily_schedule(datetime.now())
+        times = [item["time"] for item in schedule]
+        self.assertEqual(times, ["08:00", "9:00", "09:00", "10:30", "14:00", "20:00"])
+    
+    def test_untimed_entries_in_daily_schedule(self):
+        """Test entries without a time are listed first and never due"""
+        self.agent.add_medication({"name": "As Needed"})
+        self.agent.add_activity({"name": "Stretching", "scheduled_time": ""})
+        
+        schedule = self.agent._get_daily_schedule(datetime.now())
+        self.assertEqual(
+            [(item["time"], item["activity"]) for item in schedule[:2]],
+            [("", "Take As Needed"), ("", "Stretching")]
+        )
+        self.assertEqual(len(schedule), 6)
+    
+    def test_invalid_time_rejected(self):
+        """Test malformed times and dates raise ValueError and are not stored"""
+        with self.assertRaises(ValueError):
+            self.agent.add_medication({"name": "Bad Pill", "scheduled_time": "25:00"})
+        with self.assertRaises(ValueError):
+            self.agent.add_activity({"name": "Bad Walk", "scheduled_time": "noon"})
+        with self.assertRaises(ValueError):
+            self.agent.add_appointment({"doctor_name": "Dr. Smith", "date": "next week"})
+        self.assertEqual(len(self.agent.routine_database["medications"]), 2)
+        self.assertEqual(len(self.agent.routine_database["activities"]), 2)
+        self.assertEqual(len(self.agent.routine_database["appointments"]), 0)
 
 class TestSafetyAgent(unittest.TestCase):
     """Test the safety monitoring agent"""
@@ -267,15 +341,62 @@ class TestA2AIntegration(unittest.TestCase):
         self.assertIn("user_id", summary)
         self.assertIn("start_time", summary)
         self.assertIn("metrics", summary)
+    
+    def test_session_summary_metrics_are_plain(self):
+        """Test summary metrics keep the dict layout and serialize with json"""
+        asyncio.run(self.integration.process_multimodal_input({"type": "text", "content": "Who is Sarah?"}))
+        summary = json.loads(json.dumps(self.integration.get_session_summary()))
+        metrics = summary["metrics"]
+        self.assertEqual(metrics["total_interactions"], 1)
+        self.assertIn("average_response_time", metrics)
+        self.assertNotIn("response_time_sum_ns", metrics)
+    
+    def test_emergency_trigger_counted_once(self):
+        """Test each detected emergency increments the metric exactly once"""
+        input_data = {
+            "type": "text",
+            "content": "Help, this is an emergency"
+        }
+        
+        response = asyncio.run(self.integration.process_multimodal_input(input_data))
+        self.assertEqual(response["agent"], "safety_monitoring")
+        self.assertEqual(self.integration.metrics.emergency_triggers, 1)
+    
+    def test_repeated_question_cache(self):
+        """Test repeated fact lookups are answered from cache, and nothing else"""
+        interactions = self.integration.cognitive_assistant.current_context["recent_interactions"]
+        asyncio.run(self.integration.process_multimodal_input(
+            {"type": "text", "content": "Who is Sarah?"}))
+        asyncio.run(self.integration.process_multimodal_input(
+            {"type": "text", "content": "who is sarah"}))
+        self.assertEqual(self.integration.metrics.cache_hits, 1)
+        self.assertEqual(len(interactions), 2)
+        
+        # Time-dependent and side-effecting replies are always recomputed
+        for content in ("What medicine do I take today?", "Call my daughter"):
+            for _ in range(2):
+                asyncio.run(self.integration.process_multimodal_input(
+                    {"type": "text", "content": content}))
+        self.assertEqual(self.integration.metrics.cache_hits, 1)
+        
+        for _ in range(2):
+            asyncio.run(self.integration.process_multimodal_input(
+                {"type": "text", "content": "Help, this is an emergency"}))
+        self.assertEqual(self.integration.metrics.cache_hits, 1)
+        self.assertEqual(self.integration.metrics.emergency_triggers, 2)
 
 def run_async_test(test_func):
     """Helper to run async tests"""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(test_func())
-    finally:
-        loop.close()
+    @functools.wraps(test_func)
+    def wrapper(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(test_func(self))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+    return wrapper
 
 # Add async test methods to test classes
 TestCognitiveAssistant.test_process_user_input = run_async_test(TestCognitiveAssistant.test_process_user_input)